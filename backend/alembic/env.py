@@ -6,7 +6,7 @@ from alembic import context
 
 from app.config import settings
 from app.database import Base
-from app.models import Booking, Community, CommunityMember, Event, EventAttendee, FederatedResource, FederatedSkill, InstanceSyncLog, MeshCheckin, MeshSyncedMessage, Message, Resource, Skill, User, TicketComment, Webhook, TelegramLinkToken  # noqa: F401 – register models
+from app import models  # noqa: F401 – register models
 
 config = context.config
 
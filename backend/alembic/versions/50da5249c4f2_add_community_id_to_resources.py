@@ -18,12 +18,32 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _create_index_online(name: str, table: str, columns: list[str]) -> None:
+    """Create an index without blocking writes where the dialect allows it.
+
+    PostgreSQL builds it CONCURRENTLY (which must run outside a transaction,
+    hence the autocommit block); MySQL uses an in-place, lock-free ALTER.
+    """
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+    elif dialect in ('mysql', 'mariadb'):
+        op.execute(
+            f"ALTER TABLE {table} ADD INDEX {name} ({', '.join(columns)}), "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+    else:
+        op.create_index(name, table, columns, unique=False)
+
+
 def upgrade() -> None:
     with op.batch_alter_table('resources', schema=None) as batch_op:
         batch_op.add_column(sa.Column('community_id', sa.Integer(), nullable=True))
-        batch_op.create_index(batch_op.f('ix_resources_community_id'), ['community_id'], unique=False)
         batch_op.create_foreign_key('fk_resources_community_id', 'communities', ['community_id'], ['id'])
 
+    _create_index_online('ix_resources_community_id', 'resources', ['community_id'])
+
 
 def downgrade() -> None:
     with op.batch_alter_table('resources', schema=None) as batch_op:
@@ -7,7 +7,7 @@ Create Date: 2026-02-24 00:00:00.000000
 """
 from typing import Sequence, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 
 
@@ -17,13 +17,95 @@ down_revision: Union[str, None] = '50da5249c4f2'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows per backfill UPDATE – keeps each statement's lock window short
+_BACKFILL_BATCH_SIZE = 5000
+
+
+def _backfill_inventory_quantities() -> None:
+    """Set quantity_total / quantity_available = 1 on existing rows, in id ranges.
+
+    Only rows still NULL are touched, so a re-run after an interruption
+    resumes where it stopped.
+    """
+    if context.is_offline_mode():
+        # --sql scripts can't read the id range; emit one plain UPDATE.
+        op.execute(
+            "UPDATE resources SET quantity_total = 1, quantity_available = 1 "
+            "WHERE quantity_total IS NULL"
+        )
+        return
+    bind = op.get_bind()
+    min_id, max_id = bind.execute(sa.text("SELECT MIN(id), MAX(id) FROM resources")).one()
+    if min_id is None:
+        return
+    # Commit each batch on its own so locks and undo/WAL stay bounded by
+    # the batch size rather than growing with the table.
+    with op.get_context().autocommit_block():
+        for lo in range(min_id, max_id + 1, _BACKFILL_BATCH_SIZE):
+            bind.execute(
+                sa.text(
+                    "UPDATE resources SET quantity_total = 1, quantity_available = 1 "
+                    "WHERE id >= :lo AND id < :hi AND quantity_total IS NULL"
+                ),
+                {"lo": lo, "hi": lo + _BACKFILL_BATCH_SIZE},
+            )
+
+
+def _add_inventory_columns_with_backfill(single_alter: bool) -> None:
+    """Add nullable → backfill in batches → set NOT NULL.
+
+    Avoids a NOT NULL DEFAULT add that rewrites the whole table under one
+    lock on servers without metadata-only defaults.
+    """
+    if single_alter:
+        op.execute(
+            "ALTER TABLE resources "
+            "ADD COLUMN quantity_total INTEGER NULL, "
+            "ADD COLUMN quantity_available INTEGER NULL, "
+            "ADD COLUMN reorder_threshold INTEGER NULL"
+        )
+    else:
+        with op.batch_alter_table('resources', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('quantity_total', sa.Integer(), nullable=True))
+            batch_op.add_column(sa.Column('quantity_available', sa.Integer(), nullable=True))
+            batch_op.add_column(sa.Column('reorder_threshold', sa.Integer(), nullable=True))
+
+    _backfill_inventory_quantities()
+
+    if single_alter:
+        op.execute(
+            "ALTER TABLE resources "
+            "MODIFY quantity_total INTEGER NOT NULL DEFAULT 1, "
+            "MODIFY quantity_available INTEGER NOT NULL DEFAULT 1"
+        )
+    else:
+        with op.batch_alter_table('resources', schema=None) as batch_op:
+            batch_op.alter_column('quantity_total', existing_type=sa.Integer(), nullable=False, server_default='1')
+            batch_op.alter_column('quantity_available', existing_type=sa.Integer(), nullable=False, server_default='1')
+
 
 def upgrade() -> None:
+    bind = op.get_bind()
+    # PostgreSQL 11+ stores a constant default in the catalog, so adding a
+    # NOT NULL DEFAULT column is metadata-only there – no rewrite, no backfill.
+    # Older servers (and offline --sql runs, which can't see the version)
+    # take the add → backfill → constrain path instead.
+    fast_default = (
+        bind.dialect.name == "postgresql"
+        and (bind.dialect.server_version_info or (0,)) >= (11,)
+    )
+    # MySQL runs each ALTER TABLE as its own table copy/scan, while Alembic's
+    # batch ops emit one ALTER per column there – so combine them by hand.
+    single_alter = bind.dialect.name in ("mysql", "mariadb")
+
     # ── Resource inventory fields ──────────────────────────────────
-    with op.batch_alter_table('resources', schema=None) as batch_op:
-        batch_op.add_column(sa.Column('quantity_total', sa.Integer(), nullable=False, server_default='1'))
-        batch_op.add_column(sa.Column('quantity_available', sa.Integer(), nullable=False, server_default='1'))
-        batch_op.add_column(sa.Column('reorder_threshold', sa.Integer(), nullable=True))
+    if fast_default:
+        with op.batch_alter_table('resources', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('quantity_total', sa.Integer(), nullable=False, server_default='1'))
+            batch_op.add_column(sa.Column('quantity_available', sa.Integer(), nullable=False, server_default='1'))
+            batch_op.add_column(sa.Column('reorder_threshold', sa.Integer(), nullable=True))
+    else:
+        _add_inventory_columns_with_backfill(single_alter)
 
     # ── EmergencyTicket triage field ───────────────────────────────
     with op.batch_alter_table('emergency_tickets', schema=None) as batch_op:
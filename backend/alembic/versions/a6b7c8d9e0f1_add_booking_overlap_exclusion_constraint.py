@@ -0,0 +1,59 @@
+"""add exclusion constraint against overlapping live bookings
+
+Revision ID: a6b7c8d9e0f1
+Revises: f5a6b7c8d9e0
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6b7c8d9e0f1'
+down_revision: Union[str, None] = 'f5a6b7c8d9e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The application checks for overlaps before inserting, but two concurrent
+# requests can both pass that check.  An exclusion constraint makes the
+# database the arbiter.  PostgreSQL only: btree_gist supplies the GiST
+# equality operator for resource_id.  Exclusion constraints can't be added
+# NOT VALID, so existing double bookings must be resolved first; the upgrade
+# refuses with a clear message rather than failing mid-DDL.
+
+_LIVE = "status IN ('pending', 'approved')"
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    if not context.is_offline_mode():
+        conflicts = op.get_bind().execute(sa.text(
+            "SELECT count(*) FROM bookings a JOIN bookings b "
+            "ON a.resource_id = b.resource_id AND a.id < b.id "
+            "AND a.start_date <= b.end_date AND a.end_date >= b.start_date "
+            f"WHERE a.{_LIVE} AND b.{_LIVE}"
+        )).scalar()
+        if conflicts:
+            raise RuntimeError(
+                f"{conflicts} pairs of overlapping pending/approved bookings exist; "
+                "cancel or reject the duplicates before running this migration."
+            )
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    op.execute(
+        "ALTER TABLE bookings ADD CONSTRAINT ex_booking_no_overlap "
+        "EXCLUDE USING gist (resource_id WITH =, daterange(start_date, end_date, '[]') WITH &&) "
+        f"WHERE ({_LIVE})"
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_constraint('ex_booking_no_overlap', 'bookings')
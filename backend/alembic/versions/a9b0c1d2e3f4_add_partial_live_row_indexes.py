@@ -0,0 +1,54 @@
+"""add partial indexes over live invites and unused telegram link tokens
+
+Revision ID: a9b0c1d2e3f4
+Revises: f8a9b0c1d2e3
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9b0c1d2e3f4'
+down_revision: Union[str, None] = 'f8a9b0c1d2e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Revoked invites and used link tokens are kept but never queried again, so
+# indexing only the live rows keeps these indexes small as the tables grow.
+# The code/token lookups stay on their unique indexes.  Predicates can't use
+# now() (index predicates must be immutable), and MySQL has no partial
+# indexes, so it is skipped there.
+
+_INDEXES = (
+    ('ix_invites_community_active', 'invites', ['community_id'], sa.column('is_active').is_(True)),
+    (
+        'ix_telegram_link_tokens_owner_unused', 'telegram_link_tokens',
+        ['owner_id', 'token_type'], sa.column('used') == sa.false(),
+    ),
+)
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            for name, table, columns, where in _INDEXES:
+                op.create_index(
+                    name, table, columns, unique=False,
+                    postgresql_where=where, postgresql_concurrently=True,
+                )
+    elif dialect == 'sqlite':
+        for name, table, columns, where in _INDEXES:
+            op.create_index(name, table, columns, unique=False, sqlite_where=where)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name not in ('postgresql', 'sqlite'):
+        return
+    for name, table, _columns, _where in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,36 @@
+"""add denormalized member_count to communities
+
+Revision ID: b0c1d2e3f4a5
+Revises: a9b0c1d2e3f4
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b0c1d2e3f4a5'
+down_revision: Union[str, None] = 'a9b0c1d2e3f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('communities', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('member_count', sa.Integer(), nullable=False, server_default='0'))
+
+    # communities is small (one row per neighbourhood group), so a single
+    # correlated UPDATE is fine here.
+    op.execute(
+        "UPDATE communities SET member_count = ("
+        "SELECT COUNT(*) FROM community_members "
+        "WHERE community_members.community_id = communities.id)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('communities', schema=None) as batch_op:
+        batch_op.drop_column('member_count')
@@ -0,0 +1,65 @@
+"""add composite indexes for crisis votes and emergency tickets
+
+Revision ID: b7c8d9e0f1a2
+Revises: a6b7c8d9e0f1
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c8d9e0f1a2'
+down_revision: Union[str, None] = 'a6b7c8d9e0f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The crisis status counts filter on (community_id, vote_type), and the
+# ticket list reads "community_id = ? ORDER BY created_at DESC" or filters
+# by status / urgency.  Each composite's leading column covers the plain
+# community_id lookups, so the single-column indexes go.  (The unique
+# constraints on (community_id, user_id) already serve vote and membership
+# lookups.)  Built CONCURRENTLY on PostgreSQL so voting and ticketing keep
+# accepting writes.
+
+_NEW_INDEXES = (
+    ('crisis_votes', 'ix_crisis_votes_community_type', ['community_id', 'vote_type']),
+    ('emergency_tickets', 'ix_emergency_tickets_community_created', ['community_id', 'created_at']),
+    (
+        'emergency_tickets', 'ix_emergency_tickets_community_status_urgency',
+        ['community_id', 'status', 'urgency'],
+    ),
+)
+_OLD_INDEXES = (
+    ('crisis_votes', 'ix_crisis_votes_community_id'),
+    ('emergency_tickets', 'ix_emergency_tickets_community_id'),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for table, name, columns in _NEW_INDEXES:
+                op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+            for table, name in _OLD_INDEXES:
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+        return
+
+    for table, name in _OLD_INDEXES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(name)
+    for table, name, columns in _NEW_INDEXES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(name, columns, unique=False)
+
+
+def downgrade() -> None:
+    for table, name, _ in _NEW_INDEXES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.drop_index(name)
+    for table, name in _OLD_INDEXES:
+        with op.batch_alter_table(table, schema=None) as batch_op:
+            batch_op.create_index(name, ['community_id'], unique=False)
@@ -7,7 +7,7 @@ Create Date: 2026-02-28 00:00:00.000000
 """
 from typing import Sequence, Union
 
-from alembic import op
+from alembic import context, op
 import sqlalchemy as sa
 
 
@@ -17,11 +17,55 @@ down_revision: Union[str, None] = 'a1b2c3d4e5f6'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows per backfill UPDATE – keeps each statement's lock window short
+_BACKFILL_BATCH_SIZE = 5000
+
+
+def _backfill_language_code() -> None:
+    """Set language_code = 'en' on existing users, in id ranges.
+
+    Only rows still NULL are touched, so a re-run after an interruption
+    resumes where it stopped.
+    """
+    if context.is_offline_mode():
+        # --sql scripts can't read the id range; emit one plain UPDATE.
+        op.execute("UPDATE users SET language_code = 'en' WHERE language_code IS NULL")
+        return
+    bind = op.get_bind()
+    min_id, max_id = bind.execute(sa.text("SELECT MIN(id), MAX(id) FROM users")).one()
+    if min_id is None:
+        return
+    # Commit each batch on its own so locks and undo/WAL stay bounded by
+    # the batch size rather than growing with the table.
+    with op.get_context().autocommit_block():
+        for lo in range(min_id, max_id + 1, _BACKFILL_BATCH_SIZE):
+            bind.execute(
+                sa.text(
+                    "UPDATE users SET language_code = 'en' "
+                    "WHERE id >= :lo AND id < :hi AND language_code IS NULL"
+                ),
+                {"lo": lo, "hi": lo + _BACKFILL_BATCH_SIZE},
+            )
+
 
 def upgrade() -> None:
     # ── User language preference ────────────────────────────────────
-    with op.batch_alter_table('users', schema=None) as batch_op:
-        batch_op.add_column(sa.Column('language_code', sa.String(10), nullable=False, server_default='en'))
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql" and (bind.dialect.server_version_info or (0,)) >= (11,):
+        # PostgreSQL 11+ adds a constant NOT NULL DEFAULT column without
+        # rewriting the table, so no backfill is needed.
+        with op.batch_alter_table('users', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('language_code', sa.String(10), nullable=False, server_default='en'))
+    else:
+        # Add nullable → backfill in batches → set NOT NULL, instead of a
+        # NOT NULL DEFAULT add that rewrites the whole table under one lock.
+        with op.batch_alter_table('users', schema=None) as batch_op:
+            batch_op.add_column(sa.Column('language_code', sa.String(10), nullable=True))
+
+        _backfill_language_code()
+
+        with op.batch_alter_table('users', schema=None) as batch_op:
+            batch_op.alter_column('language_code', existing_type=sa.String(10), nullable=False, server_default='en')
 
     # ── Community primary language ──────────────────────────────────
     with op.batch_alter_table('communities', schema=None) as batch_op:
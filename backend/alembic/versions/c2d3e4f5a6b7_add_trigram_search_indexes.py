@@ -0,0 +1,50 @@
+"""add trigram GIN indexes for substring search
+
+Revision ID: c2d3e4f5a6b7
+Revises: b0c1d2e3f4a5
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2d3e4f5a6b7'
+down_revision: Union[str, None] = 'b0c1d2e3f4a5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The community, resource and skill searches filter with ILIKE '%q%', which a
+# B-tree can't serve.  pg_trgm's GIN operator class can, so each index covers
+# every column its search ORs together.  PostgreSQL only; elsewhere the
+# searches keep scanning.
+
+_INDEXES = (
+    ('ix_communities_search_trgm', 'communities', ['name', 'city', 'postal_code']),
+    ('ix_resources_search_trgm', 'resources', ['title', 'description']),
+    ('ix_skills_search_trgm', 'skills', ['title', 'description']),
+)
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(
+                name, table, columns, unique=False,
+                postgresql_using='gin',
+                postgresql_ops={c: 'gin_trgm_ops' for c in columns},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,71 @@
+"""replace single-column FK indexes on ticket_comments/messages with composites
+
+Revision ID: c5d6e7f8a9b0
+Revises: b4c5d6e7f8a9
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d6e7f8a9b0'
+down_revision: Union[str, None] = 'b4c5d6e7f8a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _replace_index_online(table: str, name: str, columns: list[str], old_name: str) -> None:
+    """Create index *name*, then drop *old_name*, without blocking writes where possible.
+
+    PostgreSQL builds and drops CONCURRENTLY (which must run outside a
+    transaction, hence the autocommit block); MySQL uses in-place, lock-free
+    ALTERs.  The new index is built first, so the parent lookups are never
+    left without an index.
+    """
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+            op.drop_index(old_name, table_name=table, postgresql_concurrently=True)
+    elif dialect in ('mysql', 'mariadb'):
+        op.execute(
+            f"ALTER TABLE {table} ADD INDEX {name} ({', '.join(columns)}), "
+            "ALGORITHM=INPLACE, LOCK=NONE"
+        )
+        op.execute(f"ALTER TABLE {table} DROP INDEX {old_name}, ALGORITHM=INPLACE, LOCK=NONE")
+    else:
+        op.create_index(name, table, columns, unique=False)
+        op.drop_index(old_name, table_name=table)
+
+
+# The single-column indexes below were created blindly for every FK column.
+# Both tables are only ever read as "rows for one parent, ordered by time",
+# so a (parent_id, created_at) composite serves the filter *and* the sort,
+# while its leading column still covers plain parent_id lookups.  Keeping
+# the old index alongside it would only add write overhead on every INSERT.
+# ix_resources_community_id and ix_ticket_comments_author_id stay: nothing
+# else covers those lookups.
+
+
+def upgrade() -> None:
+    _replace_index_online(
+        'ticket_comments', 'ix_ticket_comments_ticket_created', ['ticket_id', 'created_at'],
+        'ix_ticket_comments_ticket_id',
+    )
+    _replace_index_online(
+        'messages', 'ix_messages_skill_created', ['skill_id', 'created_at'], 'ix_messages_skill_id',
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('messages', schema=None) as batch_op:
+        batch_op.drop_index('ix_messages_skill_created')
+        batch_op.create_index('ix_messages_skill_id', ['skill_id'], unique=False)
+
+    with op.batch_alter_table('ticket_comments', schema=None) as batch_op:
+        batch_op.drop_index('ix_ticket_comments_ticket_created')
+        batch_op.create_index('ix_ticket_comments_ticket_id', ['ticket_id'], unique=False)
@@ -0,0 +1,46 @@
+"""add a partial index over unresolved emergency tickets
+
+Revision ID: c8d9e0f1a2b3
+Revises: b7c8d9e0f1a2
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d9e0f1a2b3'
+down_revision: Union[str, None] = 'b7c8d9e0f1a2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The triage view reads "community_id = ? AND status != 'resolved'", and
+# resolved tickets are kept forever, so indexing only the open ones keeps
+# the index at working-set size.  MySQL has no partial indexes, so it is
+# skipped there.
+
+_NAME = 'ix_emergency_tickets_unresolved'
+_COLUMNS = ['community_id', 'urgency', 'created_at']
+_WHERE = sa.column('status') != 'resolved'
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(
+                _NAME, 'emergency_tickets', _COLUMNS, unique=False,
+                postgresql_where=_WHERE, postgresql_concurrently=True,
+            )
+    elif dialect == 'sqlite':
+        op.create_index(_NAME, 'emergency_tickets', _COLUMNS, unique=False, sqlite_where=_WHERE)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name not in ('postgresql', 'sqlite'):
+        return
+    op.drop_index(_NAME, table_name='emergency_tickets')
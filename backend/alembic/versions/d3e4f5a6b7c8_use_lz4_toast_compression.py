@@ -0,0 +1,62 @@
+"""use lz4 TOAST compression for large text columns
+
+Revision ID: d3e4f5a6b7c8
+Revises: c2d3e4f5a6b7
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3e4f5a6b7c8'
+down_revision: Union[str, None] = 'c2d3e4f5a6b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The free-text columns carry most of each row's payload.  LZ4 decompresses
+# considerably faster than the default PGLZ for a similar ratio on short user
+# text.  SET COMPRESSION only changes catalog metadata (no table rewrite):
+# values written afterwards use LZ4, existing ones stay PGLZ until updated.
+#
+# Needs PostgreSQL 14+ built with lz4.  The check runs server-side inside the
+# DO block so the same SQL is safe online, in --sql scripts, and on servers
+# without lz4, where it does nothing.
+
+_COLUMNS = (
+    ('messages', 'body'),
+    ('resources', 'description'),
+    ('emergency_tickets', 'description'),
+    ('ticket_comments', 'body'),
+    ('red_sky_alerts', 'description'),
+    ('activities', 'summary'),
+)
+
+
+def _set_compression(method: str) -> None:
+    alters = ' '.join(
+        f'ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION {method};'
+        for table, column in _COLUMNS
+    )
+    op.execute(
+        "DO $$ BEGIN "
+        "IF EXISTS (SELECT 1 FROM pg_settings "
+        "WHERE name = 'default_toast_compression' AND 'lz4' = ANY(enumvals)) THEN "
+        f"{alters} "
+        "END IF; END $$"
+    )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _set_compression('lz4')
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    _set_compression('pglz')
@@ -0,0 +1,51 @@
+"""replace ix_activities_community_id with a (community_id, created_at) composite
+
+Revision ID: d6e7f8a9b0c1
+Revises: c5d6e7f8a9b0
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd6e7f8a9b0c1'
+down_revision: Union[str, None] = 'c5d6e7f8a9b0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The community feed is read as "WHERE community_id = ? ORDER BY created_at
+# DESC LIMIT n"; the composite serves both the filter and the sort (scanned
+# backwards), and its leading column still covers plain community_id lookups.
+# On PostgreSQL the index is built CONCURRENTLY so the activity feed keeps
+# accepting writes; that cannot run inside a transaction, hence the
+# autocommit block.
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'ix_activities_community_created', 'activities',
+                ['community_id', 'created_at'], unique=False,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                'ix_activities_community_id', table_name='activities',
+                postgresql_concurrently=True,
+            )
+        return
+
+    with op.batch_alter_table('activities', schema=None) as batch_op:
+        batch_op.drop_index('ix_activities_community_id')
+        batch_op.create_index('ix_activities_community_created', ['community_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('activities', schema=None) as batch_op:
+        batch_op.drop_index('ix_activities_community_created')
+        batch_op.create_index('ix_activities_community_id', ['community_id'], unique=False)
@@ -0,0 +1,44 @@
+"""add messages (sender_id, recipient_id, created_at) composite index
+
+Revision ID: d9e0f1a2b3c4
+Revises: c8d9e0f1a2b3
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9e0f1a2b3c4'
+down_revision: Union[str, None] = 'c8d9e0f1a2b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Conversation reads filter on a (sender_id, recipient_id) pair and order by
+# created_at.  The composite's leading column also serves plain sender_id
+# lookups, so ix_messages_sender_id goes.  Built CONCURRENTLY on PostgreSQL
+# so messaging keeps accepting writes.
+
+_NAME = 'ix_messages_sender_recipient_created'
+_COLUMNS = ['sender_id', 'recipient_id', 'created_at']
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(_NAME, 'messages', _COLUMNS, unique=False, postgresql_concurrently=True)
+            op.drop_index('ix_messages_sender_id', table_name='messages', postgresql_concurrently=True)
+        return
+
+    with op.batch_alter_table('messages', schema=None) as batch_op:
+        batch_op.drop_index('ix_messages_sender_id')
+        batch_op.create_index(_NAME, _COLUMNS, unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('messages', schema=None) as batch_op:
+        batch_op.drop_index(_NAME)
+        batch_op.create_index('ix_messages_sender_id', ['sender_id'], unique=False)
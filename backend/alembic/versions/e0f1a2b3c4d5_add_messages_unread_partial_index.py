@@ -0,0 +1,45 @@
+"""add partial index over unread messages
+
+Revision ID: e0f1a2b3c4d5
+Revises: d9e0f1a2b3c4
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e0f1a2b3c4d5'
+down_revision: Union[str, None] = 'd9e0f1a2b3c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# The unread badge counts "recipient_id = ? AND is_read = false", and read
+# messages are kept forever, so indexing only the unread ones keeps the
+# index small and lets the count skip the table.  MySQL has no partial
+# indexes, so it is skipped there.
+
+_NAME = 'ix_messages_unread'
+_WHERE = sa.column('is_read') == sa.false()
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(
+                _NAME, 'messages', ['recipient_id'], unique=False,
+                postgresql_where=_WHERE, postgresql_concurrently=True,
+            )
+    elif dialect == 'sqlite':
+        op.create_index(_NAME, 'messages', ['recipient_id'], unique=False, sqlite_where=_WHERE)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name not in ('postgresql', 'sqlite'):
+        return
+    op.drop_index(_NAME, table_name='messages')
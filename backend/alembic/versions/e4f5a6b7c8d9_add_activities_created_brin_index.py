@@ -0,0 +1,41 @@
+"""add BRIN index on activities.created_at
+
+Revision ID: e4f5a6b7c8d9
+Revises: d3e4f5a6b7c8
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4f5a6b7c8d9'
+down_revision: Union[str, None] = 'd3e4f5a6b7c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# activities is append-only, so created_at follows physical row order and a
+# BRIN index answers the instance-wide "last 30 days" window for a few pages
+# of summaries.  The per-community/per-actor feeds stay on their B-trees.
+# PostgreSQL only.
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_activities_created_brin', 'activities', ['created_at'], unique=False,
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_activities_created_brin', table_name='activities')
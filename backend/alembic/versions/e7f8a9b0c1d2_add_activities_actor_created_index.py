@@ -0,0 +1,49 @@
+"""replace ix_activities_actor_id with an (actor_id, created_at) composite
+
+Revision ID: e7f8a9b0c1d2
+Revises: d6e7f8a9b0c1
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7f8a9b0c1d2'
+down_revision: Union[str, None] = 'd6e7f8a9b0c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# /activity/my reads "WHERE actor_id = ? ORDER BY created_at DESC LIMIT n",
+# the same shape as the community feed that d6e7f8a9b0c1 indexed.  On
+# PostgreSQL the index is built CONCURRENTLY, which cannot run inside a
+# transaction, hence the autocommit block.
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'ix_activities_actor_created', 'activities',
+                ['actor_id', 'created_at'], unique=False,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                'ix_activities_actor_id', table_name='activities',
+                postgresql_concurrently=True,
+            )
+        return
+
+    with op.batch_alter_table('activities', schema=None) as batch_op:
+        batch_op.drop_index('ix_activities_actor_id')
+        batch_op.create_index('ix_activities_actor_created', ['actor_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('activities', schema=None) as batch_op:
+        batch_op.drop_index('ix_activities_actor_created')
+        batch_op.create_index('ix_activities_actor_id', ['actor_id'], unique=False)
@@ -0,0 +1,53 @@
+"""replace ix_bookings_resource_id with a composite for date-overlap checks
+
+Revision ID: f5a6b7c8d9e0
+Revises: e4f5a6b7c8d9
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a6b7c8d9e0'
+down_revision: Union[str, None] = 'e4f5a6b7c8d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Booking creation checks "resource_id = ? AND status IN ('pending',
+# 'approved') AND start_date <= ? AND end_date >= ?", and the calendar reads
+# the same shape.  With all four columns in the index neither touches the
+# table for rows that don't overlap.  The leading column still covers plain
+# resource_id lookups, so the single-column index goes.  Built CONCURRENTLY
+# on PostgreSQL so bookings keep accepting writes.
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            op.create_index(
+                'ix_bookings_resource_status_dates', 'bookings',
+                ['resource_id', 'status', 'start_date', 'end_date'], unique=False,
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                'ix_bookings_resource_id', table_name='bookings',
+                postgresql_concurrently=True,
+            )
+        return
+
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.drop_index('ix_bookings_resource_id')
+        batch_op.create_index(
+            'ix_bookings_resource_status_dates',
+            ['resource_id', 'status', 'start_date', 'end_date'], unique=False,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('bookings', schema=None) as batch_op:
+        batch_op.drop_index('ix_bookings_resource_status_dates')
+        batch_op.create_index('ix_bookings_resource_id', ['resource_id'], unique=False)
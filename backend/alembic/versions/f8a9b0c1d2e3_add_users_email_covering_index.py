@@ -0,0 +1,40 @@
+"""add covering email index for the login lookup (PostgreSQL only)
+
+Revision ID: f8a9b0c1d2e3
+Revises: e7f8a9b0c1d2
+Create Date: 2026-10-16 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f8a9b0c1d2e3'
+down_revision: Union[str, None] = 'e7f8a9b0c1d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Login selects (id, hashed_password, is_active) by email.  INCLUDE-ing those
+# columns lets PostgreSQL answer it with an index-only scan.  Other dialects
+# have no INCLUDE clause and keep using the unique ix_users_email index.
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email_covering', 'users', ['email'], unique=False,
+            postgresql_include=['id', 'hashed_password', 'is_active'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_users_email_covering', table_name='users')
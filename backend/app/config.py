@@ -1,7 +1,9 @@
 """Application configuration using pydantic-settings."""
 
+import hmac
 import logging
 import warnings
+from functools import lru_cache
 
 from pydantic_settings import BaseSettings
 
@@ -15,6 +17,15 @@ class Settings(BaseSettings):
     app_version: str = "1.9.5.1"
     debug: bool = False
     database_url: str = "sqlite:///./neighbourgood.db"
+    # Connection pool (server databases only).  Sync endpoints run in a
+    # threadpool of 40; pool_size + max_overflow matches it, so no thread
+    # queues on a connection during bursts such as crisis votes.  A checkout
+    # that still waits pool_timeout seconds fails instead of piling up, and
+    # connections are recycled before server/proxy idle timeouts cut them.
+    db_pool_size: int = 20
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 5
+    db_pool_recycle: int = 1800
 
     # Dual-state: "blue" (normal) or "red" (crisis)
     platform_mode: str = "blue"
@@ -22,6 +33,7 @@ class Settings(BaseSettings):
     # Auth
     secret_key: str = _DEFAULT_SECRET
     access_token_expire_minutes: int = 60 * 24  # 24 hours
+    bcrypt_rounds: int = 12  # cost factor for new hashes (~250 ms per hash at 12)
 
     # Uploads
     upload_dir: str = "uploads"
@@ -60,13 +72,25 @@ class Settings(BaseSettings):
     ai_model: str = "llama3.2"
     ai_api_key: str | None = None       # Required for OpenAI, optional for Ollama
 
-    model_config = {"env_prefix": "NG_", "env_file": ".env"}
+    # The literal defaults above are already well-typed; only values coming
+    # from the environment / .env need validating.
+    model_config = {"env_prefix": "NG_", "env_file": ".env", "validate_default": False}
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing env / ``.env`` only once.
+
+    Call ``get_settings.cache_clear()`` to force a re-read (e.g. in tests).
+    """
+    return Settings()
+
+
+settings = get_settings()
 
 # ── Secret key validation ──────────────────────────────────────────
-if settings.secret_key == _DEFAULT_SECRET:
+# Constant-time compare: never leak how much of the key matches the default.
+if hmac.compare_digest(settings.secret_key.encode(), _DEFAULT_SECRET.encode()):
     if settings.debug:
         warnings.warn(
             "Using default secret key – set NG_SECRET_KEY in production!",
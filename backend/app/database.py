@@ -1,18 +1,33 @@
 """Database setup with SQLAlchemy + SQLite (PostgreSQL-ready)."""
 
-from sqlalchemy import create_engine
+from sqlalchemy import DDL, create_engine, event, make_url
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.config import settings
 
 connect_args = {}
+engine_kwargs = {}
 if settings.database_url.startswith("sqlite"):
     connect_args["check_same_thread"] = False
+else:
+    engine_kwargs["pool_size"] = settings.db_pool_size
+    engine_kwargs["max_overflow"] = settings.db_max_overflow
+    engine_kwargs["pool_timeout"] = settings.db_pool_timeout
+    engine_kwargs["pool_recycle"] = settings.db_pool_recycle
+    if make_url(settings.database_url).get_driver_name() == "psycopg2":
+        # Multi-row INSERTs already go out as batched VALUES; this also batches
+        # executemany UPDATE/DELETE (e.g. one flush touching many rows) into a
+        # few round-trips instead of one per row.
+        engine_kwargs["executemany_mode"] = "values_plus_batch"
 
 engine = create_engine(
     settings.database_url,
     connect_args=connect_args,
     pool_pre_ping=True,
+    # Room for every distinct statement shape across all routers; the default
+    # of 500 can evict and recompile hot queries.
+    query_cache_size=2000,
+    **engine_kwargs,
 )
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -21,6 +36,17 @@ class Base(DeclarativeBase):
     pass
 
 
+# The search indexes use trigram operator classes and the booking overlap
+# constraint mixes = and && in one GiST index; create_all can only build them
+# once these extensions exist.
+for _extension in ("pg_trgm", "btree_gist"):
+    event.listen(
+        Base.metadata,
+        "before_create",
+        DDL(f"CREATE EXTENSION IF NOT EXISTS {_extension}").execute_if(dialect="postgresql"),
+    )
+
+
 def get_db():
     """Dependency that provides a database session per request."""
     db = SessionLocal()
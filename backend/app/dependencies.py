@@ -12,6 +12,21 @@ security = HTTPBearer()
 security_optional = HTTPBearer(auto_error=False)
 
 
+def _load_active_user(db: Session, user_id: int) -> User | None:
+    """Fetch the user behind a token, or None if missing or deactivated.
+
+    ``Session.get`` checks the identity map first, so a user already loaded
+    in this session costs no query.  Only the ``users`` row is loaded: no
+    handler reaches through ``current_user`` into a relationship, so
+    eager-loading any would add queries to every authenticated request
+    rather than save them.
+    """
+    user = db.get(User, user_id)
+    if user is None or not user.is_active:
+        return None
+    return user
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db),
@@ -19,8 +34,8 @@ def get_current_user(
     user_id = decode_access_token(credentials.credentials)
     if user_id is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None or not user.is_active:
+    user = _load_active_user(db, user_id)
+    if user is None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
     return user
 
@@ -36,9 +51,6 @@ def get_current_user_optional(
         user_id = decode_access_token(credentials.credentials)
         if user_id is None:
             return None
-        user = db.query(User).filter(User.id == user_id).first()
-        if user is None or not user.is_active:
-            return None
-        return user
+        return _load_active_user(db, user_id)
     except Exception:
         return None
@@ -1,12 +1,13 @@
 """NeighbourGood API – main application entry point."""
 
+import importlib
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy import inspect, text
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import settings
 from app.database import Base, engine
@@ -14,65 +15,146 @@ from app.database import Base, engine
 logger = logging.getLogger(__name__)
 from app.middleware.csrf import CsrfMiddleware
 from app.middleware.rate_limit import RateLimitMiddleware
-from app.models import Activity, Booking, Community, CommunityMember, CrisisVote, EmergencyTicket, Event, EventAttendee, FederatedResource, FederatedSkill, InstanceSyncLog, Invite, KnownInstance, MeshCheckin, MeshSyncedMessage, Message, RedSkyAlert, Resource, Review, Skill, TelegramLinkToken, User, Webhook  # noqa: F401 – ensure models are registered
-from app.routers import activity, auth, bookings, communities, crisis, events, federation, federation_sync, instance, invites, matching, mesh_sync, messages, resources, reviews, skills, status, users, webhooks
-from app.routers import telegram as telegram_router
+from app import models  # noqa: F401 – registers and configures all mappers
 
 
 # ── Security headers middleware ────────────────────────────────────
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Inject security-related HTTP response headers."""
+# Encoded once at import time; each response only appends the ready-made
+# byte pairs.
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"camera=(), microphone=(), geolocation=(self)"),
+    (b"x-xss-protection", b"0"),
+)
+
+# Production-only: HSTS and CSP would break plain-HTTP local development.
+_PROD_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"strict-transport-security", b"max-age=63072000; includeSubDomains"),
+    (b"content-security-policy", b"default-src 'self'"),
+)
 
-    async def dispatch(self, request: Request, call_next) -> Response:
-        response = await call_next(request)
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "camera=(), microphone=(), geolocation=(self)"
-        response.headers["X-XSS-Protection"] = "0"
-        if not settings.debug:
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=63072000; includeSubDomains"
-            )
-            response.headers["Content-Security-Policy"] = "default-src 'self'"
-        return response
+
+class SecurityHeadersMiddleware:
+    """Inject security-related HTTP response headers.
+
+    Plain ASGI rather than ``BaseHTTPMiddleware``: headers are appended to
+    the ``http.response.start`` message directly, so no extra task or body
+    stream is wrapped around every request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.extend(_SECURITY_HEADERS)
+                if not settings.debug:
+                    headers.extend(_PROD_SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
 
 
 # ── Application setup ──────────────────────────────────────────────
 
 
-def _add_missing_columns() -> None:
+def _existing_columns() -> dict[str, set[str]]:
+    """Return ``{table: {column, ...}}`` for every table in the database.
+
+    ``get_multi_columns`` fetches every table's columns in a single pass, so
+    this costs one introspection round-trip regardless of the table count.
+    """
+    return {
+        table_name: {c["name"] for c in columns}
+        for (_, table_name), columns in inspect(engine).get_multi_columns().items()
+    }
+
+
+def _schema_is_current(present: dict[str, set[str]]) -> bool:
+    """Return True if every ORM table and column already exists in the DB."""
+    for table_name, table in Base.metadata.tables.items():
+        existing = present.get(table_name)
+        if existing is None or any(col.name not in existing for col in table.columns):
+            return False
+    return True
+
+
+# Derived columns that must be computed, not defaulted, when the drift pass
+# adds them to an existing database.
+_DRIFT_BACKFILLS: dict[tuple[str, str], str] = {
+    ("communities", "member_count"): (
+        "UPDATE communities SET member_count = ("
+        "SELECT COUNT(*) FROM community_members "
+        "WHERE community_members.community_id = communities.id)"
+    ),
+}
+
+
+def _add_missing_columns(present: dict[str, set[str]] | None = None) -> None:
     """Inspect every ORM table and ADD columns that the DB is missing.
 
     This is a safety net so that existing databases pick up new nullable
     columns without requiring a manual ``alembic upgrade head``.  Only
     additive — never drops or renames columns.
+
+    Each ALTER is committed on its own (autocommit), so a table's lock is
+    released as soon as its column is added instead of being held until the
+    whole pass finishes.  Re-running is safe: only absent columns are added.
     """
-    inspector = inspect(engine)
-    with engine.connect() as conn:
-        for table_name, table in Base.metadata.tables.items():
-            if not inspector.has_table(table_name):
-                continue
-            existing = {c["name"] for c in inspector.get_columns(table_name)}
-            for col in table.columns:
-                if col.name not in existing:
-                    col_type = col.type.compile(engine.dialect)
-                    sql = f'ALTER TABLE {table_name} ADD COLUMN {col.name} {col_type}'
-                    if col.default is not None:
-                        sql += f" DEFAULT {col.default.arg!r}"
-                    if col.server_default is not None:
-                        sql += f" DEFAULT {col.server_default.arg.text}"
-                    conn.execute(text(sql))
-                    logger.info("Added missing column %s.%s", table_name, col.name)
-        conn.commit()
+    if present is None:
+        present = _existing_columns()
+
+    missing: list[tuple[str, str, str]] = []
+    for table_name, table in Base.metadata.tables.items():
+        existing = present.get(table_name)
+        if existing is None:
+            continue
+        for col in table.columns:
+            if col.name not in existing:
+                col_type = col.type.compile(engine.dialect)
+                sql = f'ALTER TABLE {table_name} ADD COLUMN {col.name} {col_type}'
+                if col.default is not None:
+                    sql += f" DEFAULT {col.default.arg!r}"
+                if col.server_default is not None:
+                    sql += f" DEFAULT {col.server_default.arg.text}"
+                missing.append((table_name, col.name, sql))
+
+    if not missing:
+        return
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table_name, col_name, sql in missing:
+            conn.execute(text(sql))
+            logger.info("Added missing column %s.%s", table_name, col_name)
+            backfill = _DRIFT_BACKFILLS.get((table_name, col_name))
+            if backfill is not None:
+                conn.execute(text(backfill))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    Base.metadata.create_all(bind=engine)
-    _add_missing_columns()
+    # Prefetch the live schema once; a database that already matches the
+    # models (the common case on every restart) skips create_all's per-table
+    # existence checks and the ALTER pass entirely.
+    present = _existing_columns()
+    if not _schema_is_current(present):
+        # Only the tables known to be absent are created, so create_all
+        # neither walks the full metadata nor re-checks each table.
+        missing = [t for name, t in Base.metadata.tables.items() if name not in present]
+        if missing:
+            Base.metadata.create_all(bind=engine, tables=missing, checkfirst=False)
+        _add_missing_columns(present)
     yield
 
 
@@ -91,27 +173,44 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Explicit lists rather than "*": Starlette then answers preflights from
+    # a precomputed set instead of echoing back whatever the browser asks for.
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+    allow_headers=[
+        "Accept",
+        "Accept-Language",
+        "Authorization",
+        "Content-Language",
+        "Content-Type",
+        "Origin",
+        "X-CSRF-Token",
+        "X-Requested-With",
+    ],
+)
+
+# Registration order is significant: it determines route matching order.
+_ROUTERS = (
+    "status",
+    "auth",
+    "users",
+    "resources",
+    "bookings",
+    "messages",
+    "communities",
+    "crisis",
+    "skills",
+    "events",
+    "activity",
+    "invites",
+    "reviews",
+    "instance",
+    "federation",
+    "federation_sync",
+    "webhooks",
+    "mesh_sync",
+    "matching",
+    "telegram",
 )
 
-app.include_router(status.router)
-app.include_router(auth.router)
-app.include_router(users.router)
-app.include_router(resources.router)
-app.include_router(bookings.router)
-app.include_router(messages.router)
-app.include_router(communities.router)
-app.include_router(crisis.router)
-app.include_router(skills.router)
-app.include_router(events.router)
-app.include_router(activity.router)
-app.include_router(invites.router)
-app.include_router(reviews.router)
-app.include_router(instance.router)
-app.include_router(federation.router)
-app.include_router(federation_sync.router)
-app.include_router(webhooks.router)
-app.include_router(mesh_sync.router)
-app.include_router(matching.router)
-app.include_router(telegram_router.router)
+for _name in _ROUTERS:
+    app.include_router(importlib.import_module(f"app.routers.{_name}").router)
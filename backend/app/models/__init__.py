@@ -15,6 +15,12 @@ from app.models.mesh_checkin import MeshCheckin
 from app.models.sync import FederatedResource, FederatedSkill, InstanceSyncLog
 from app.models.event import Event, EventAttendee
 
+from sqlalchemy.orm import configure_mappers
+
+# Every model is imported above, so resolve all relationships in one pass now
+# instead of lazily on first query.
+configure_mappers()
+
 __all__ = [
     "User", "Resource", "Booking", "Message", "Community", "CommunityMember",
     "Skill", "Activity", "Invite", "Review", "KnownInstance", "RedSkyAlert",
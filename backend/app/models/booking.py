@@ -2,7 +2,8 @@
 
 import datetime
 
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, String, Text, column, func, literal_column
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -12,9 +13,25 @@ BOOKING_STATUSES = ["pending", "approved", "rejected", "cancelled", "completed"]
 
 class Booking(Base):
     __tablename__ = "bookings"
+    __table_args__ = (
+        # Serves the overlap check and the calendar ("resource_id = ? AND
+        # status IN (...) AND start_date <= ? AND end_date >= ?") from the
+        # index alone; the leading column also covers plain resource lookups.
+        Index("ix_bookings_resource_status_dates", "resource_id", "status", "start_date", "end_date"),
+        # No two live bookings of one resource may overlap – enforced by the
+        # database so concurrent requests can't both pass the overlap check.
+        # PostgreSQL only (needs btree_gist for the integer column).
+        ExcludeConstraint(
+            ("resource_id", "="),
+            (func.daterange(column("start_date"), column("end_date"), literal_column("'[]'")), "&&"),
+            name="ex_booking_no_overlap",
+            using="gist",
+            where=column("status").in_(["pending", "approved"]),
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    resource_id: Mapped[int] = mapped_column(Integer, ForeignKey("resources.id"), nullable=False, index=True)
+    resource_id: Mapped[int] = mapped_column(Integer, ForeignKey("resources.id"), nullable=False)
     borrower_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     start_date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
     end_date: Mapped[datetime.date] = mapped_column(Date, nullable=False)
@@ -2,7 +2,7 @@
 
 import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, UniqueConstraint, event, func, update
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -10,6 +10,19 @@ from app.database import Base
 
 class Community(Base):
     __tablename__ = "communities"
+    __table_args__ = (
+        # Trigram GIN so the '%q%' ILIKE search can use an index (PostgreSQL).
+        Index(
+            "ix_communities_search_trgm",
+            "name", "city", "postal_code",
+            postgresql_using="gin",
+            postgresql_ops={
+                "name": "gin_trgm_ops",
+                "city": "gin_trgm_ops",
+                "postal_code": "gin_trgm_ops",
+            },
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(150), nullable=False)
@@ -23,6 +36,9 @@ class Community(Base):
     latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
     longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
     telegram_group_id: Mapped[str | None] = mapped_column(String(50), nullable=True)
+    # Denormalized COUNT of community_members rows, kept in step by the
+    # CommunityMember insert/delete hooks below.
+    member_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     created_by_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     merged_into_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("communities.id"), nullable=True, index=True)
     created_at: Mapped[datetime.datetime] = mapped_column(
@@ -33,7 +49,11 @@ class Community(Base):
     merged_into: Mapped["Community | None"] = relationship(
         foreign_keys=[merged_into_id], remote_side=[id]
     )
-    members: Mapped[list["CommunityMember"]] = relationship(back_populates="community")
+    # raise_on_sql: members/user must be loaded explicitly (selectinload) –
+    # lazy loads here turn every list of communities or members into N+1.
+    members: Mapped[list["CommunityMember"]] = relationship(
+        back_populates="community", lazy="raise_on_sql"
+    )
 
 
 class CommunityMember(Base):
@@ -51,4 +71,31 @@ class CommunityMember(Base):
     )
 
     community: Mapped["Community"] = relationship(back_populates="members")
-    user: Mapped["User"] = relationship()  # noqa: F821
+    user: Mapped["User"] = relationship(lazy="raise_on_sql")  # noqa: F821
+
+
+# ── member_count maintenance ───────────────────────────────────────
+# The counter is bumped with a single UPDATE ... SET member_count =
+# member_count ± 1 on the flush connection, so concurrent joins cannot lose
+# an increment.  A Community already loaded in the session sees the new
+# value after the next commit/refresh.  Bulk Query.delete() bypasses these
+# hooks – delete memberships one by one.
+
+
+def _bump_member_count(connection, community_id: int, delta: int) -> None:
+    table = Community.__table__
+    connection.execute(
+        update(table)
+        .where(table.c.id == community_id)
+        .values(member_count=table.c.member_count + delta)
+    )
+
+
+@event.listens_for(CommunityMember, "after_insert")
+def _member_inserted(mapper, connection, target: CommunityMember) -> None:
+    _bump_member_count(connection, target.community_id, 1)
+
+
+@event.listens_for(CommunityMember, "after_delete")
+def _member_deleted(mapper, connection, target: CommunityMember) -> None:
+    _bump_member_count(connection, target.community_id, -1)
@@ -2,7 +2,7 @@
 
 import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint, column, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -12,11 +12,13 @@ class CrisisVote(Base):
     __tablename__ = "crisis_votes"
     __table_args__ = (
         UniqueConstraint("community_id", "user_id", name="uq_crisis_vote_community_user"),
+        # Serves the per-type vote counts; also covers plain community_id lookups
+        Index("ix_crisis_votes_community_type", "community_id", "vote_type"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     community_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("communities.id"), nullable=False, index=True
+        Integer, ForeignKey("communities.id"), nullable=False
     )
     user_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id"), nullable=False, index=True
@@ -34,10 +36,29 @@ class CrisisVote(Base):
 
 class EmergencyTicket(Base):
     __tablename__ = "emergency_tickets"
+    __table_args__ = (
+        # Serves "tickets in a community, newest first" without a sort step;
+        # also covers plain community_id lookups
+        Index("ix_emergency_tickets_community_created", "community_id", "created_at"),
+        # Serves the status / urgency list filters
+        Index("ix_emergency_tickets_community_status_urgency", "community_id", "status", "urgency"),
+        # Unresolved tickets only: the triage view never reads resolved ones,
+        # which make up most of a mature community's tickets.
+        Index(
+            "ix_emergency_tickets_unresolved",
+            "community_id",
+            "urgency",
+            "created_at",
+            postgresql_where=column("status") != "resolved",
+            sqlite_where=column("status") != "resolved",
+        ).ddl_if(dialect=("postgresql", "sqlite")),
+    )
+    # Fetch updated_at via RETURNING on UPDATE too, so writes needn't refresh
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     community_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("communities.id"), nullable=False, index=True
+        Integer, ForeignKey("communities.id"), nullable=False
     )
     author_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id"), nullable=False, index=True
@@ -72,10 +93,14 @@ class EmergencyTicket(Base):
 
 class TicketComment(Base):
     __tablename__ = "ticket_comments"
+    __table_args__ = (
+        # Serves "comments for a ticket, oldest first"; also covers plain ticket_id lookups
+        Index("ix_ticket_comments_ticket_created", "ticket_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     ticket_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("emergency_tickets.id"), nullable=False, index=True
+        Integer, ForeignKey("emergency_tickets.id"), nullable=False
     )
     author_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("users.id"), nullable=False, index=True
@@ -2,7 +2,7 @@
 
 import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, column, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -10,6 +10,16 @@ from app.database import Base
 
 class Invite(Base):
     __tablename__ = "invites"
+    __table_args__ = (
+        # Live invites only: revoked ones pile up but are never listed.  The
+        # predicate mirrors the list query so both planners can match it.
+        Index(
+            "ix_invites_community_active",
+            "community_id",
+            postgresql_where=column("is_active").is_(True),
+            sqlite_where=column("is_active").is_(True),
+        ).ddl_if(dialect=("postgresql", "sqlite")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     code: Mapped[str] = mapped_column(String(32), unique=True, index=True, nullable=False)
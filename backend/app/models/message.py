@@ -2,7 +2,7 @@
 
 import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, Text, column, false, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -10,12 +10,27 @@ from app.database import Base
 
 class Message(Base):
     __tablename__ = "messages"
+    __table_args__ = (
+        # Serves "messages about a skill, newest first"; also covers plain skill_id lookups
+        Index("ix_messages_skill_created", "skill_id", "created_at"),
+        # Serves one conversation's messages newest first; also covers plain
+        # sender_id lookups
+        Index("ix_messages_sender_recipient_created", "sender_id", "recipient_id", "created_at"),
+        # Unread messages only: the badge count never reads the (far more
+        # numerous) read ones.
+        Index(
+            "ix_messages_unread",
+            "recipient_id",
+            postgresql_where=column("is_read") == false(),
+            sqlite_where=column("is_read") == false(),
+        ).ddl_if(dialect=("postgresql", "sqlite")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    sender_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    sender_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False)
     recipient_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     booking_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("bookings.id"), nullable=True, index=True)
-    skill_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("skills.id"), nullable=True, index=True)
+    skill_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("skills.id"), nullable=True)
     body: Mapped[str] = mapped_column(Text, nullable=False)
     is_read: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime.datetime] = mapped_column(
@@ -2,7 +2,7 @@
 
 import datetime
 
-from sqlalchemy import Boolean, DateTime, Integer, String, func
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -10,6 +10,16 @@ from app.database import Base
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Login reads only (id, hashed_password, is_active) by email; with
+        # those INCLUDEd the lookup is index-only.  INCLUDE is PostgreSQL
+        # syntax, elsewhere the unique email index already serves the query.
+        Index(
+            "ix_users_email_covering",
+            "email",
+            postgresql_include=["id", "hashed_password", "is_active"],
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True, nullable=False)
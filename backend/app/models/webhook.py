@@ -2,7 +2,7 @@
 
 import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, column, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -25,6 +25,17 @@ class Webhook(Base):
 
 class TelegramLinkToken(Base):
     __tablename__ = "telegram_link_tokens"
+    __table_args__ = (
+        # Unused tokens only: used ones are kept forever but never queried
+        # again.  Serves the invalidate-previous-token DELETE on every link.
+        Index(
+            "ix_telegram_link_tokens_owner_unused",
+            "owner_id",
+            "token_type",
+            postgresql_where=column("used") == False,  # noqa: E712
+            sqlite_where=column("used") == False,  # noqa: E712
+        ).ddl_if(dialect=("postgresql", "sqlite")),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     token: Mapped[str] = mapped_column(String(64), unique=True, index=True, nullable=False)
@@ -1,54 +1,150 @@
 """Community activity feed endpoints."""
 
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session, joinedload
+import base64
+import binascii
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, and_, func, or_, select
+from sqlalchemy.orm import Session
 
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.activity import Activity
 from app.models.user import User
 from app.schemas.activity import ActivityList, ActivityOut
+from app.utils.db import user_profile_bundle
 
 router = APIRouter(prefix="/activity", tags=["activity"])
 
+# The feed is read-only, so pages are fetched as plain rows shaped like
+# ActivityOut rather than hydrated into ORM objects.
+_FEED_COLUMNS = (
+    Activity.id,
+    Activity.event_type,
+    Activity.summary,
+    Activity.actor_id,
+    Activity.community_id,
+    Activity.created_at,
+    user_profile_bundle("actor"),
+)
+
+# Built once: validates a whole page in a single core call instead of one
+# model_validate dispatch per row.
+_ACTIVITY_LIST_ADAPTER = TypeAdapter(list[ActivityOut])
+
+
+def _encode_cursor(activity_id: int) -> str:
+    return base64.urlsafe_b64encode(str(activity_id).encode()).rstrip(b"=").decode()
+
+
+def _decode_cursor(cursor: str) -> int:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(padded).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def _page(
+    db: Session,
+    criteria: list[ColumnElement[bool]],
+    cursor: str | None,
+    limit: int,
+    include_total: bool,
+    skip: int | None = None,
+) -> ActivityList:
+    """Fetch one feed page, newest first, using keyset pagination.
+
+    Pages are ordered by ``(created_at, id)`` descending and continue after
+    the row named by ``cursor``.  The cursor row's sort key is read back by
+    primary key, so stored values are compared with stored values and the
+    seek stays on the ``(…, created_at)`` composite indexes however deep the
+    page.  A cursor whose row has since been deleted is rejected with 400
+    rather than silently ending the feed.
+    One extra row is fetched to tell whether another page follows; the
+    COUNT only runs when the caller explicitly asks for ``total``.
+
+    ``skip`` is the deprecated offset pagination from before cursors: it
+    can't be combined with ``cursor``, and it always counts ``total`` as
+    the old responses did.
+    """
+    if skip is not None:
+        if cursor is not None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Use either cursor or skip, not both",
+            )
+        include_total = True
+
+    total = (
+        db.scalar(select(func.count()).select_from(Activity).where(*criteria))
+        if include_total
+        else None
+    )
+
+    if cursor is not None:
+        after_id = _decode_cursor(cursor)
+        after_created = db.scalar(select(Activity.created_at).where(Activity.id == after_id))
+        if after_created is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor row no longer exists"
+            )
+        criteria = [
+            *criteria,
+            or_(
+                Activity.created_at < after_created,
+                and_(Activity.created_at == after_created, Activity.id < after_id),
+            ),
+        ]
+
+    rows = db.execute(
+        select(*_FEED_COLUMNS)
+        .join(User, User.id == Activity.actor_id)
+        .where(*criteria)
+        .order_by(Activity.created_at.desc(), Activity.id.desc())
+        .offset(skip)
+        .limit(limit + 1)
+    ).all()
+    items = rows[:limit]
+    has_more = len(rows) > limit
+    return ActivityList(
+        items=_ACTIVITY_LIST_ADAPTER.validate_python(items, from_attributes=True),
+        total=total,
+        has_more=has_more,
+        next_cursor=_encode_cursor(items[-1].id) if has_more else None,
+    )
+
 
 @router.get("", response_model=ActivityList)
 def list_activity(
     community_id: int | None = Query(None, description="Filter by community"),
-    skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    skip: int | None = Query(
+        None, ge=0, deprecated=True, description="Offset pagination; use cursor instead"
+    ),
     limit: int = Query(20, ge=1, le=100),
+    include_total: bool = Query(False, description="Also count all matching events"),
     db: Session = Depends(get_db),
 ):
     """List recent activity events, optionally filtered by community."""
-    query = db.query(Activity).options(joinedload(Activity.actor))
-
+    criteria = []
     if community_id is not None:
-        query = query.filter(Activity.community_id == community_id)
+        criteria.append(Activity.community_id == community_id)
 
-    total = query.count()
-    items = query.order_by(Activity.created_at.desc()).offset(skip).limit(limit).all()
-    return ActivityList(
-        items=[ActivityOut.model_validate(a) for a in items],
-        total=total,
-    )
+    return _page(db, criteria, cursor, limit, include_total, skip)
 
 
 @router.get("/my", response_model=ActivityList)
 def list_my_activity(
-    skip: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    skip: int | None = Query(
+        None, ge=0, deprecated=True, description="Offset pagination; use cursor instead"
+    ),
     limit: int = Query(20, ge=1, le=100),
+    include_total: bool = Query(False, description="Also count all matching events"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """List the authenticated user's own activity."""
-    query = (
-        db.query(Activity)
-        .options(joinedload(Activity.actor))
-        .filter(Activity.actor_id == current_user.id)
-    )
-    total = query.count()
-    items = query.order_by(Activity.created_at.desc()).offset(skip).limit(limit).all()
-    return ActivityList(
-        items=[ActivityOut.model_validate(a) for a in items],
-        total=total,
-    )
+    return _page(db, [Activity.actor_id == current_user.id], cursor, limit, include_total, skip)
@@ -3,7 +3,9 @@
 import datetime
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
-from sqlalchemy import and_, or_
+from pydantic import TypeAdapter
+from sqlalchemy import Date, Exists, Text, and_, exists, insert, literal, or_, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
@@ -12,8 +14,10 @@ from app.models.booking import BOOKING_STATUSES, Booking
 from app.models.resource import Resource
 from app.models.user import User
 from app.services.activity import record_activity
+from app.services.cache import TTLCache
 from app.services.notifications import notify_booking_request, notify_booking_status
 from app.services.webhooks import dispatch_event
+from app.utils.db import paginate_rows, user_profile_bundle
 from app.schemas.booking import (
     BookingCreate,
     BookingList,
@@ -23,6 +27,15 @@ from app.schemas.booking import (
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
 
+# (resource_id, year, month) → calendar page.  Booking writes below drop the
+# resource's months; the TTL bounds staleness from other workers and from
+# edits elsewhere (resource titles, borrower profiles).
+_calendar_cache = TTLCache(ttl=60)
+
+
+def _invalidate_calendar(resource_id: int) -> None:
+    _calendar_cache.invalidate(lambda key: key[0] == resource_id)
+
 
 def _booking_to_out(b: Booking) -> BookingOut:
     return BookingOut(
@@ -40,19 +53,41 @@ def _booking_to_out(b: Booking) -> BookingOut:
     )
 
 
-def _check_date_conflict(
-    db: Session, resource_id: int, start: datetime.date, end: datetime.date, exclude_id: int | None = None
-) -> bool:
-    """Return True if there is an overlapping approved/pending booking."""
-    q = db.query(Booking).filter(
+# SQLSTATE exclusion_violation – raised only by ex_booking_no_overlap on bookings.
+_EXCLUSION_VIOLATION = "23P01"
+
+
+def _is_overlap_violation(exc: IntegrityError) -> bool:
+    """Whether *exc* is the overlap exclusion constraint rejecting a booking."""
+    return getattr(exc.orig, "pgcode", None) == _EXCLUSION_VIOLATION
+
+
+# Read paths (list, detail, calendar) select plain rows shaped like BookingOut –
+# no Booking, Resource or User objects are hydrated for them.
+_BOOKING_LIST_COLUMNS = (
+    Booking.id,
+    Booking.resource_id,
+    Resource.title.label("resource_title"),
+    Booking.borrower_id,
+    user_profile_bundle("borrower"),
+    Booking.start_date,
+    Booking.end_date,
+    Booking.message,
+    Booking.status,
+    Booking.created_at,
+    Booking.updated_at,
+)
+_BOOKING_LIST_ADAPTER = TypeAdapter(list[BookingOut])
+
+
+def _overlapping_booking(resource_id: int, start: datetime.date, end: datetime.date) -> Exists:
+    """EXISTS clause matching an overlapping approved/pending booking."""
+    return exists().where(
         Booking.resource_id == resource_id,
         Booking.status.in_(["pending", "approved"]),
         Booking.start_date <= end,
         Booking.end_date >= start,
     )
-    if exclude_id:
-        q = q.filter(Booking.id != exclude_id)
-    return q.first() is not None
 
 
 @router.post("", response_model=BookingOut, status_code=status.HTTP_201_CREATED)
@@ -63,7 +98,12 @@ def create_booking(
     db: Session = Depends(get_db),
 ):
     """Request to borrow a resource for a date range."""
-    resource = db.query(Resource).filter(Resource.id == body.resource_id).first()
+    resource = (
+        db.query(Resource)
+        .options(joinedload(Resource.owner))
+        .filter(Resource.id == body.resource_id)
+        .first()
+    )
     if not resource:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resource not found")
     if not resource.is_available:
@@ -77,36 +117,71 @@ def create_booking(
             detail="end_date must be >= start_date",
         )
 
-    if _check_date_conflict(db, body.resource_id, body.start_date, body.end_date):
+    # The overlap check and the insert are one statement: the row is only
+    # written if no conflicting booking exists, and the server-generated
+    # columns come back with it, so no separate check or refresh query runs.
+    try:
+        created = db.execute(
+            insert(Booking)
+            .from_select(
+                ["resource_id", "borrower_id", "start_date", "end_date", "message", "status"],
+                select(
+                    literal(body.resource_id),
+                    literal(current_user.id),
+                    literal(body.start_date, Date),
+                    literal(body.end_date, Date),
+                    literal(body.message, Text),
+                    literal("pending"),
+                ).where(~_overlapping_booking(body.resource_id, body.start_date, body.end_date)),
+            )
+            .returning(Booking.id, Booking.status, Booking.created_at, Booking.updated_at)
+        ).first()
+    except IntegrityError as exc:
+        # Lost a race with a concurrent booking: PostgreSQL's exclusion
+        # constraint rejected the row after the NOT EXISTS guard passed.
+        # Any other constraint failure is a real error, not an overlap.
+        if not _is_overlap_violation(exc):
+            raise
+        db.rollback()
+        created = None
+    if created is None:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Dates overlap with an existing booking",
         )
 
-    booking = Booking(
+    # Built before commit expires the loaded instances.
+    out = BookingOut(
+        id=created.id,
         resource_id=body.resource_id,
+        resource_title=resource.title,
         borrower_id=current_user.id,
+        borrower=current_user,
         start_date=body.start_date,
         end_date=body.end_date,
         message=body.message,
+        status=created.status,
+        created_at=created.created_at,
+        updated_at=created.updated_at,
     )
-    db.add(booking)
+    owner_id, owner = resource.owner_id, resource.owner
+    owner_email = owner.email if owner else None
+    resource_title, community_id = resource.title, resource.community_id
+    borrower_id, borrower_name = current_user.id, current_user.display_name
     db.commit()
-    db.refresh(booking)
-    _ = booking.borrower
-    _ = booking.resource
+    _invalidate_calendar(body.resource_id)
 
     # Notify resource owner
-    owner = db.query(User).filter(User.id == resource.owner_id).first()
-    if owner:
-        notify_booking_request(owner.email, current_user.display_name, resource.title)
+    if owner_email:
+        notify_booking_request(owner_email, borrower_name, resource_title)
 
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="resource_borrowed",
-        summary=f"requested to borrow \"{resource.title}\"",
-        actor_id=current_user.id,
-        community_id=resource.community_id,
+        summary=f"requested to borrow \"{resource_title}\"",
+        actor_id=borrower_id,
+        community_id=community_id,
     )
 
     background_tasks.add_task(
@@ -114,15 +189,15 @@ def create_booking(
         db,
         "booking.created",
         {
-            "borrower_name": current_user.display_name,
-            "resource_title": resource.title,
+            "borrower_name": borrower_name,
+            "resource_title": resource_title,
             "start_date": str(body.start_date),
             "end_date": str(body.end_date),
         },
-        [resource.owner_id],
+        [owner_id],
     )
 
-    return _booking_to_out(booking)
+    return out
 
 
 @router.get("", response_model=BookingList)
@@ -136,35 +211,39 @@ def list_bookings(
     db: Session = Depends(get_db),
 ):
     """List bookings relevant to the current user (as borrower or resource owner)."""
-    query = db.query(Booking).options(
-        joinedload(Booking.borrower),
-        joinedload(Booking.resource),
+    # The resource is joined for its title anyway, so "bookings of resources
+    # I own" is a filter on the joined row rather than a subquery.  Outer, as
+    # in get_booking, so a booking whose resource is gone still lists.
+    stmt = (
+        select(*_BOOKING_LIST_COLUMNS)
+        .join(User, User.id == Booking.borrower_id)
+        .outerjoin(Resource, Resource.id == Booking.resource_id)
     )
 
     if role == "owner":
         # Bookings for resources I own
-        owned_ids = [r.id for r in db.query(Resource.id).filter(Resource.owner_id == current_user.id).all()]
-        query = query.filter(Booking.resource_id.in_(owned_ids))
+        stmt = stmt.where(Resource.owner_id == current_user.id)
     elif role == "borrower":
-        query = query.filter(Booking.borrower_id == current_user.id)
+        stmt = stmt.where(Booking.borrower_id == current_user.id)
     else:
         # Default: show both
-        owned_ids = [r.id for r in db.query(Resource.id).filter(Resource.owner_id == current_user.id).all()]
-        query = query.filter(
+        stmt = stmt.where(
             or_(
                 Booking.borrower_id == current_user.id,
-                Booking.resource_id.in_(owned_ids),
+                Resource.owner_id == current_user.id,
             )
         )
 
     if resource_id is not None:
-        query = query.filter(Booking.resource_id == resource_id)
+        stmt = stmt.where(Booking.resource_id == resource_id)
     if status_filter:
-        query = query.filter(Booking.status == status_filter)
+        stmt = stmt.where(Booking.status == status_filter)
 
-    total = query.count()
-    items = query.order_by(Booking.created_at.desc()).offset(skip).limit(limit).all()
-    return BookingList(items=[_booking_to_out(b) for b in items], total=total)
+    rows, total = paginate_rows(db, stmt, (Booking.created_at.desc(),), skip, limit)
+    return BookingList(
+        items=_BOOKING_LIST_ADAPTER.validate_python(rows, from_attributes=True),
+        total=total,
+    )
 
 
 @router.get("/{booking_id}", response_model=BookingOut)
@@ -174,20 +253,19 @@ def get_booking(
     db: Session = Depends(get_db),
 ):
     """Get a single booking (must be borrower or resource owner)."""
-    booking = (
-        db.query(Booking)
-        .options(joinedload(Booking.borrower), joinedload(Booking.resource))
-        .filter(Booking.id == booking_id)
-        .first()
-    )
-    if not booking:
+    row = db.execute(
+        select(*_BOOKING_LIST_COLUMNS, Resource.owner_id)
+        .join(User, User.id == Booking.borrower_id)
+        .outerjoin(Resource, Resource.id == Booking.resource_id)
+        .where(Booking.id == booking_id)
+    ).first()
+    if not row:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Booking not found")
 
-    resource = db.query(Resource).filter(Resource.id == booking.resource_id).first()
-    if booking.borrower_id != current_user.id and (not resource or resource.owner_id != current_user.id):
+    if row.borrower_id != current_user.id and row.owner_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not your booking")
 
-    return _booking_to_out(booking)
+    return BookingOut.model_validate(row, from_attributes=True)
 
 
 @router.patch("/{booking_id}", response_model=BookingOut)
@@ -214,7 +292,7 @@ def update_booking_status(
             detail=f"Invalid status. Must be one of: {BOOKING_STATUSES}",
         )
 
-    resource = db.query(Resource).filter(Resource.id == booking.resource_id).first()
+    resource = booking.resource
     is_owner = resource and resource.owner_id == current_user.id
     is_borrower = booking.borrower_id == current_user.id
 
@@ -231,6 +309,7 @@ def update_booking_status(
 
     booking.status = body.status
     db.commit()
+    _invalidate_calendar(booking.resource_id)
     db.refresh(booking)
 
     # Notify borrower about status change
@@ -247,7 +326,8 @@ def update_booking_status(
         )
 
     if body.status == "completed":
-        record_activity(
+        background_tasks.add_task(
+            record_activity,
             db,
             event_type="booking_completed",
             summary=f"completed a booking for \"{resource_title}\"",
@@ -266,29 +346,33 @@ def get_resource_calendar(
     db: Session = Depends(get_db),
 ):
     """Get all active bookings for a resource in a given month (for calendar display)."""
-    resource = db.query(Resource).filter(Resource.id == resource_id).first()
-    if not resource:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resource not found")
 
-    first_day = datetime.date(year, month, 1)
-    if month == 12:
-        last_day = datetime.date(year + 1, 1, 1) - datetime.timedelta(days=1)
-    else:
-        last_day = datetime.date(year, month + 1, 1) - datetime.timedelta(days=1)
+    def _load() -> list[BookingOut]:
+        resource = db.query(Resource).filter(Resource.id == resource_id).first()
+        if not resource:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Resource not found")
+
+        first_day = datetime.date(year, month, 1)
+        if month == 12:
+            last_day = datetime.date(year + 1, 1, 1) - datetime.timedelta(days=1)
+        else:
+            last_day = datetime.date(year, month + 1, 1) - datetime.timedelta(days=1)
+
+        rows = db.execute(
+            select(*_BOOKING_LIST_COLUMNS)
+            .join(Resource, Resource.id == Booking.resource_id)
+            .join(User, User.id == Booking.borrower_id)
+            .where(
+                Booking.resource_id == resource_id,
+                Booking.status.in_(["pending", "approved"]),
+                Booking.start_date <= last_day,
+                Booking.end_date >= first_day,
+            )
+            .order_by(Booking.start_date)
+        ).all()
+        return _BOOKING_LIST_ADAPTER.validate_python(rows, from_attributes=True)
 
-    bookings = (
-        db.query(Booking)
-        .options(joinedload(Booking.borrower), joinedload(Booking.resource))
-        .filter(
-            Booking.resource_id == resource_id,
-            Booking.status.in_(["pending", "approved"]),
-            Booking.start_date <= last_day,
-            Booking.end_date >= first_day,
-        )
-        .order_by(Booking.start_date)
-        .all()
-    )
-    return [_booking_to_out(b) for b in bookings]
+    return _calendar_cache.get_or_set((resource_id, year, month), _load)
 
 
 def _allowed_transitions(current: str, is_owner: bool, is_borrower: bool) -> list[str]:
@@ -1,8 +1,9 @@
 """Community endpoints – neighbourhood groups with PLZ-based discovery and merge."""
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session, joinedload
+from pydantic import TypeAdapter
+from sqlalchemy import ScalarSelect, case, exists, func, insert, literal, or_, select
+from sqlalchemy.orm import Session, aliased, joinedload
 
 from app.database import get_db
 from app.dependencies import get_current_user
@@ -12,6 +13,7 @@ from app.models.skill import Skill
 from app.models.user import User
 from app.services.activity import record_activity
 from app.services.webhooks import dispatch_event
+from app.utils.db import paginate_rows, user_profile_bundle
 from app.schemas.community import (
     CommunityCreate,
     CommunityList,
@@ -26,7 +28,7 @@ from app.schemas.community import (
 router = APIRouter(prefix="/communities", tags=["communities"])
 
 
-def _community_to_out(c: Community, member_count: int | None = None) -> CommunityOut:
+def _community_to_out(c: Community) -> CommunityOut:
     return CommunityOut(
         id=c.id,
         name=c.name,
@@ -38,65 +40,79 @@ def _community_to_out(c: Community, member_count: int | None = None) -> Communit
         mode=c.mode,
         latitude=c.latitude,
         longitude=c.longitude,
-        member_count=member_count if member_count is not None else len(c.members),
+        member_count=c.member_count,
         created_by=c.created_by,
         merged_into_id=c.merged_into_id,
         created_at=c.created_at,
     )
 
 
+# List endpoints read plain rows shaped like CommunityOut (the same
+# fields _community_to_out fills) instead of hydrated Community objects.
+_COMMUNITY_LIST_COLUMNS = (
+    Community.id,
+    Community.name,
+    Community.description,
+    Community.postal_code,
+    Community.city,
+    Community.country_code,
+    Community.is_active,
+    Community.mode,
+    Community.latitude,
+    Community.longitude,
+    Community.member_count,
+    user_profile_bundle("created_by"),
+    Community.merged_into_id,
+    Community.created_at,
+)
+_COMMUNITY_LIST_ADAPTER = TypeAdapter(list[CommunityOut])
+
+_MERGE_SUGGESTION_LIMIT = 20
+
+
 # ── Public map data ────────────────────────────────────────────────
 
 
+def _count(model) -> ScalarSelect[int]:
+    return (
+        select(func.count())
+        .where(model.community_id == Community.id)
+        .correlate(Community)
+        .scalar_subquery()
+    )
+
+
+# The map query takes no parameters, so it is built once at import time;
+# each request only hits the compiled-SQL cache instead of rebuilding the
+# select and its two subqueries.
+_MAP_QUERY = select(
+    Community.id,
+    Community.name,
+    Community.city,
+    Community.postal_code,
+    Community.country_code,
+    Community.member_count,
+    _count(Resource).label("resource_count"),
+    _count(Skill).label("skill_count"),
+    Community.mode,
+    Community.latitude,
+    Community.longitude,
+).where(
+    Community.is_active == True,  # noqa: E712
+    Community.merged_into_id == None,  # noqa: E711
+)
+
+
 @router.get("/map", response_model=list[CommunityMapItem])
 def get_communities_for_map(db: Session = Depends(get_db)):
-    """Return lightweight community data for the public explore map. No auth required."""
-    communities = (
-        db.query(Community)
-        .options(joinedload(Community.members))
-        .filter(
-            Community.is_active == True,  # noqa: E712
-            Community.merged_into_id == None,  # noqa: E711
-        )
-        .all()
-    )
+    """Return lightweight community data for the public explore map. No auth required.
 
-    # Batch-count resources and skills per community
-    community_ids = [c.id for c in communities]
-    resource_counts: dict[int, int] = {}
-    skill_counts: dict[int, int] = {}
-    if community_ids:
-        for cid, cnt in (
-            db.query(Resource.community_id, func.count(Resource.id))
-            .filter(Resource.community_id.in_(community_ids))
-            .group_by(Resource.community_id)
-            .all()
-        ):
-            resource_counts[cid] = cnt
-        for cid, cnt in (
-            db.query(Skill.community_id, func.count(Skill.id))
-            .filter(Skill.community_id.in_(community_ids))
-            .group_by(Skill.community_id)
-            .all()
-        ):
-            skill_counts[cid] = cnt
-
-    return [
-        CommunityMapItem(
-            id=c.id,
-            name=c.name,
-            city=c.city,
-            postal_code=c.postal_code,
-            country_code=c.country_code,
-            member_count=len(c.members),
-            resource_count=resource_counts.get(c.id, 0),
-            skill_count=skill_counts.get(c.id, 0),
-            mode=c.mode,
-            latitude=c.latitude,
-            longitude=c.longitude,
-        )
-        for c in communities
-    ]
+    One statement: member_count is stored on the row, and the resource and
+    skill counts are correlated subqueries, each an index-only count on
+    its ``community_id`` index.
+    """
+    rows = db.execute(_MAP_QUERY)
+    return [CommunityMapItem(**row._mapping) for row in rows]
 
 
 # ── Search / Discovery ──────────────────────────────────────────────
@@ -112,21 +128,22 @@ def search_communities(
     db: Session = Depends(get_db),
 ):
     """Search communities by name, city, or postal code. Used during onboarding."""
-    query = db.query(Community).options(
-        joinedload(Community.created_by),
-        joinedload(Community.members),
-    ).filter(
-        Community.is_active == True,  # noqa: E712
-        Community.merged_into_id == None,  # noqa: E711
+    stmt = (
+        select(*_COMMUNITY_LIST_COLUMNS)
+        .join(User, User.id == Community.created_by_id)
+        .where(
+            Community.is_active == True,  # noqa: E712
+            Community.merged_into_id == None,  # noqa: E711
+        )
     )
 
     if postal_code:
-        query = query.filter(Community.postal_code == postal_code)
+        stmt = stmt.where(Community.postal_code == postal_code)
     if city:
-        query = query.filter(Community.city.ilike(f"%{city}%"))
+        stmt = stmt.where(Community.city.ilike(f"%{city}%"))
     if q:
         pattern = f"%{q}%"
-        query = query.filter(
+        stmt = stmt.where(
             or_(
                 Community.name.ilike(pattern),
                 Community.city.ilike(pattern),
@@ -134,10 +151,9 @@ def search_communities(
             )
         )
 
-    total = query.count()
-    items = query.order_by(Community.created_at.desc()).offset(skip).limit(limit).all()
+    rows, total = paginate_rows(db, stmt, (Community.created_at.desc(),), skip, limit)
     return CommunityList(
-        items=[_community_to_out(c) for c in items],
+        items=_COMMUNITY_LIST_ADAPTER.validate_python(rows, from_attributes=True),
         total=total,
     )
 
@@ -177,7 +193,7 @@ def create_community(
     # Re-fetch with eager-loaded relationships to ensure proper serialization
     community = (
         db.query(Community)
-        .options(joinedload(Community.created_by), joinedload(Community.members))
+        .options(joinedload(Community.created_by))
         .filter(Community.id == community.id)
         .first()
     )
@@ -189,7 +205,7 @@ def get_community(community_id: int, db: Session = Depends(get_db)):
     """Get a community by ID."""
     community = (
         db.query(Community)
-        .options(joinedload(Community.created_by), joinedload(Community.members))
+        .options(joinedload(Community.created_by))
         .filter(Community.id == community_id)
         .first()
     )
@@ -208,7 +224,7 @@ def update_community(
     """Update community info (admin only)."""
     community = (
         db.query(Community)
-        .options(joinedload(Community.created_by), joinedload(Community.members))
+        .options(joinedload(Community.created_by))
         .filter(Community.id == community_id)
         .first()
     )
@@ -242,22 +258,13 @@ def my_communities(
     db: Session = Depends(get_db),
 ):
     """List communities the current user belongs to."""
-    memberships = (
-        db.query(CommunityMember)
-        .filter(CommunityMember.user_id == current_user.id)
-        .all()
-    )
-    community_ids = [m.community_id for m in memberships]
-    if not community_ids:
-        return []
-
-    communities = (
-        db.query(Community)
-        .options(joinedload(Community.created_by), joinedload(Community.members))
-        .filter(Community.id.in_(community_ids))
-        .all()
-    )
-    return [_community_to_out(c) for c in communities]
+    rows = db.execute(
+        select(*_COMMUNITY_LIST_COLUMNS)
+        .join(CommunityMember, CommunityMember.community_id == Community.id)
+        .join(User, User.id == Community.created_by_id)
+        .where(CommunityMember.user_id == current_user.id)
+    ).all()
+    return _COMMUNITY_LIST_ADAPTER.validate_python(rows, from_attributes=True)
 
 
 # ── Merge suggestions (must be before /{community_id} to avoid path conflict) ──
@@ -269,46 +276,43 @@ def get_merge_suggestions(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """Get automatic merge suggestions based on proximity (same postal code or city)."""
-    community = (
-        db.query(Community)
-        .options(joinedload(Community.created_by), joinedload(Community.members))
-        .filter(Community.id == community_id)
-        .first()
+    """Get automatic merge suggestions based on proximity (same postal code or city).
+
+    Same-postal-code candidates sort first and the list is capped at
+    ``_MERGE_SUGGESTION_LIMIT``, so a large city never returns (or
+    hydrates) every community in it.
+    """
+    community_select = select(*_COMMUNITY_LIST_COLUMNS).join(
+        User, User.id == Community.created_by_id
     )
+    community = db.execute(
+        community_select.where(Community.id == community_id)
+    ).first()
     if not community:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Community not found")
 
+    same_postal_code = Community.postal_code == community.postal_code
     # Find communities with same postal code or city, excluding self and merged ones
-    candidates = (
-        db.query(Community)
-        .options(joinedload(Community.created_by), joinedload(Community.members))
-        .filter(
+    candidates = db.execute(
+        community_select.where(
             Community.id != community_id,
             Community.is_active == True,  # noqa: E712
             Community.merged_into_id == None,  # noqa: E711
-            or_(
-                Community.postal_code == community.postal_code,
-                Community.city == community.city,
-            ),
+            or_(same_postal_code, Community.city == community.city),
         )
-        .all()
-    )
+        .order_by(case((same_postal_code, 0), else_=1), Community.id)
+        .limit(_MERGE_SUGGESTION_LIMIT)
+    ).all()
 
+    source = CommunityOut.model_validate(community, from_attributes=True)
     suggestions = []
-    for candidate in candidates:
-        if candidate.postal_code == community.postal_code:
+    for target in _COMMUNITY_LIST_ADAPTER.validate_python(candidates, from_attributes=True):
+        if target.postal_code == community.postal_code:
             reason = f"Same postal code ({community.postal_code})"
         else:
             reason = f"Same city ({community.city})"
 
-        suggestions.append(
-            MergeSuggestion(
-                source=_community_to_out(community),
-                target=_community_to_out(candidate),
-                reason=reason,
-            )
-        )
+        suggestions.append(MergeSuggestion(source=source, target=target, reason=reason))
 
     return suggestions
 
@@ -352,7 +356,8 @@ def join_community(
     db.commit()
     db.refresh(membership)
     _ = membership.user
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="member_joined",
         summary=f"joined \"{community.name}\"",
@@ -419,13 +424,13 @@ def merge_communities(
     """Merge source community into target. Both community admins or the source admin can initiate."""
     source = (
         db.query(Community)
-        .options(joinedload(Community.members), joinedload(Community.created_by))
+        .options(joinedload(Community.created_by))
         .filter(Community.id == body.source_id)
         .first()
     )
     target = (
         db.query(Community)
-        .options(joinedload(Community.members), joinedload(Community.created_by))
+        .options(joinedload(Community.created_by))
         .filter(Community.id == body.target_id)
         .first()
     )
@@ -446,16 +451,26 @@ def merge_communities(
     if not source_membership or source_membership.role != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Must be admin of source community")
 
-    # Move members from source to target (skip duplicates)
-    target_user_ids = {m.user_id for m in target.members}
-    for member in source.members:
-        if member.user_id not in target_user_ids:
-            new_member = CommunityMember(
-                community_id=target.id,
-                user_id=member.user_id,
-                role="member",
+    # Move members from source to target (skip duplicates) in one
+    # INSERT ... SELECT.  It bypasses the per-row member_count hook, so the
+    # target's counter is bumped by the inserted row count instead.
+    existing = aliased(CommunityMember)
+    moved = db.execute(
+        insert(CommunityMember).from_select(
+            ["community_id", "user_id", "role"],
+            select(literal(target.id), CommunityMember.user_id, literal("member"))
+            .where(
+                CommunityMember.community_id == source.id,
+                ~exists().where(
+                    existing.community_id == target.id,
+                    existing.user_id == CommunityMember.user_id,
+                ),
             )
-            db.add(new_member)
+            .order_by(CommunityMember.joined_at),
+        )
+    ).rowcount
+    if moved:
+        target.member_count = Community.member_count + moved
 
     # Mark source as merged
     source.merged_into_id = target.id
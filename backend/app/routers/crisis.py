@@ -1,23 +1,22 @@
 """Red Sky (crisis) mode endpoints – toggle, voting, emergency tickets, leaders."""
 
 import datetime
+from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response, status
+from sqlalchemy import and_, case, delete, func, select, true, update
+from sqlalchemy.orm import Session, joinedload, raiseload
 
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models.community import Community, CommunityMember
 from app.models.crisis import CrisisVote, EmergencyTicket, TicketComment
 from app.models.user import User
+from app.services import crisis_status
 from app.services.activity import record_activity
 from app.services.webhooks import dispatch_event
-from app.utils.authorization import (
-    require_admin,
-    require_admin_or_leader,
-    require_community,
-    require_membership,
-)
+from app.utils.authorization import require_community, require_member_community
+from app.utils.db import dialect_insert, paginate
 from app.schemas.crisis import (
     CrisisModeStatus,
     CrisisModeToggle,
@@ -41,15 +40,17 @@ VOTE_THRESHOLD_PCT = 60  # percentage of members needed to trigger mode change
 _URGENCY_RANK: dict[str, int] = {"low": 1, "medium": 2, "high": 3, "critical": 4}
 
 
-def _triage_score(ticket: EmergencyTicket) -> int:
+def _triage_score(ticket: EmergencyTicket, now: datetime.datetime | None = None) -> int:
     """Compute a triage priority score for a ticket.
 
     Score = urgency_weight * 100 + age_hours (capped at 99).
     Higher score → show first in the triage view.
     When a due_at is set and overdue, add 200 to escalate above non-overdue tickets.
+    List endpoints pass one *now* for the whole page.
     """
     urgency_weight = _URGENCY_RANK.get(ticket.urgency, 1)
-    now = datetime.datetime.utcnow()
+    if now is None:
+        now = datetime.datetime.utcnow()
     age_hours = min(int((now - ticket.created_at).total_seconds() / 3600), 99)
     score = urgency_weight * 100 + age_hours
     if ticket.due_at and ticket.due_at < now:
@@ -57,7 +58,26 @@ def _triage_score(ticket: EmergencyTicket) -> int:
     return score
 
 
-def _ticket_to_out(ticket: EmergencyTicket) -> EmergencyTicketOut:
+def _triage_order(now: datetime.datetime) -> tuple[Any, ...]:
+    """ORDER BY clauses that sort tickets by :func:`_triage_score`, highest first.
+
+    The urgency and overdue terms are multiples of 100 and the age term stays
+    within 0–99, so the score orders by that 100s "band" first and then by
+    age – i.e. oldest first – with no date arithmetic in SQL.  Tickets past
+    the 99-hour cap share a score; they simply stay oldest first.
+    """
+    band = case(
+        {urgency: rank * 100 for urgency, rank in _URGENCY_RANK.items()},
+        value=EmergencyTicket.urgency,
+        else_=100,
+    ) + case(
+        (and_(EmergencyTicket.due_at.is_not(None), EmergencyTicket.due_at < now), 200),
+        else_=0,
+    )
+    return band.desc(), EmergencyTicket.created_at.asc(), EmergencyTicket.id.asc()
+
+
+def _ticket_to_out(ticket: EmergencyTicket, now: datetime.datetime | None = None) -> EmergencyTicketOut:
     """Build EmergencyTicketOut with the computed triage_score."""
     return EmergencyTicketOut(
         id=ticket.id,
@@ -69,23 +89,25 @@ def _ticket_to_out(ticket: EmergencyTicket) -> EmergencyTicketOut:
         status=ticket.status,
         urgency=ticket.urgency,
         due_at=ticket.due_at,
-        triage_score=_triage_score(ticket),
+        triage_score=_triage_score(ticket, now),
         assigned_to=ticket.assigned_to,
         created_at=ticket.created_at,
         updated_at=ticket.updated_at,
     )
 
 
-# ── Local helpers ─────────────────────────────────────────────────
+def _ticket_list_response(
+    tickets: list[EmergencyTicket], total: int, now: datetime.datetime
+) -> Response:
+    """Serialize a ticket page to JSON in one pass.
 
-
-def _get_community(db: Session, community_id: int) -> Community:
-    community = db.query(Community).filter(Community.id == community_id).first()
-    if not community or not community.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Community not found"
-        )
-    return community
+    Returning the model would have FastAPI re-validate it against the
+    response_model, dump it to dicts and json.dumps those; pydantic-core
+    writes the bytes directly instead.  The route keeps its response_model
+    for the OpenAPI schema.
+    """
+    page = EmergencyTicketList(items=[_ticket_to_out(t, now) for t in tickets], total=total)
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
 # ── Crisis mode toggle (admin only) ──────────────────────────────
@@ -100,20 +122,27 @@ def toggle_crisis_mode(
     db: Session = Depends(get_db),
 ):
     """Admin-only: force-toggle the community between blue (normal) and red (crisis) mode."""
-    community = _get_community(db, community_id)
-    require_admin(db, community_id, current_user.id)
+    community, _ = require_member_community(db, community_id, current_user.id, admin_only=True)
 
     community.mode = body.mode
-    # Clear existing votes when admin overrides
-    db.query(CrisisVote).filter(CrisisVote.community_id == community_id).delete()
+    # Read before commit expires the row; nothing else needs reloading.
+    community_name, total_members = community.name, community.member_count
+    # Clear existing votes when admin overrides.  No CrisisVote objects are
+    # loaded in these requests, so bulk deletes skip identity-map syncing.
+    db.execute(
+        delete(CrisisVote)
+        .where(CrisisVote.community_id == community_id)
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
-    db.refresh(community)
+    crisis_status.invalidate(community_id)
 
     label = "Red Sky (crisis)" if body.mode == "red" else "Blue Sky (normal)"
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="crisis_mode_changed",
-        summary=f'switched "{community.name}" to {label}',
+        summary=f'switched "{community_name}" to {label}',
         actor_id=current_user.id,
         community_id=community_id,
     )
@@ -129,20 +158,15 @@ def toggle_crisis_mode(
             dispatch_event,
             db,
             "crisis.mode_changed",
-            {"community_name": community.name, "new_mode": body.mode},
+            {"community_name": community_name, "new_mode": body.mode},
             member_ids,
             community_id,
         )
 
-    total = (
-        db.query(CommunityMember)
-        .filter(CommunityMember.community_id == community_id)
-        .count()
-    )
     return CrisisModeStatus(
         community_id=community_id,
-        mode=community.mode,
-        total_members=total,
+        mode=body.mode,
+        total_members=total_members,
         threshold_pct=VOTE_THRESHOLD_PCT,
     )
 
@@ -152,39 +176,49 @@ def get_crisis_status(
     community_id: int,
     db: Session = Depends(get_db),
 ):
-    """Get crisis mode status including vote counts."""
-    community = _get_community(db, community_id)
+    """Get crisis mode status including vote counts.
 
-    total = (
-        db.query(CommunityMember)
-        .filter(CommunityMember.community_id == community_id)
-        .count()
-    )
-    activate_votes = (
-        db.query(CrisisVote)
-        .filter(
-            CrisisVote.community_id == community_id,
-            CrisisVote.vote_type == "activate",
-        )
-        .count()
-    )
-    deactivate_votes = (
-        db.query(CrisisVote)
-        .filter(
-            CrisisVote.community_id == community_id,
-            CrisisVote.vote_type == "deactivate",
+    One round-trip: the community row is cross-joined with a single-row
+    aggregate that counts both vote types in one pass over the votes.
+    Responses are cached for a few seconds, since clients poll this.
+    """
+
+    def _load() -> CrisisModeStatus:
+        votes = (
+            select(
+                func.count().filter(CrisisVote.vote_type == "activate").label("activate"),
+                func.count().filter(CrisisVote.vote_type == "deactivate").label("deactivate"),
+            )
+            .where(CrisisVote.community_id == community_id)
+            .subquery()
+        )
+        community = db.execute(
+            select(
+                Community.is_active,
+                Community.mode,
+                Community.member_count,
+                votes.c.activate,
+                votes.c.deactivate,
+            )
+            .select_from(Community)
+            .join(votes, true())
+            .where(Community.id == community_id)
+        ).first()
+        if not community or not community.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND, detail="Community not found"
+            )
+
+        return CrisisModeStatus(
+            community_id=community_id,
+            mode=community.mode,
+            votes_to_activate=community.activate,
+            votes_to_deactivate=community.deactivate,
+            total_members=community.member_count,
+            threshold_pct=VOTE_THRESHOLD_PCT,
         )
-        .count()
-    )
 
-    return CrisisModeStatus(
-        community_id=community_id,
-        mode=community.mode,
-        votes_to_activate=activate_votes,
-        votes_to_deactivate=deactivate_votes,
-        total_members=total,
-        threshold_pct=VOTE_THRESHOLD_PCT,
-    )
+    return crisis_status.get_or_load(community_id, _load)
 
 
 # ── Community vote ────────────────────────────────────────────────
@@ -194,84 +228,88 @@ def get_crisis_status(
 def cast_crisis_vote(
     community_id: int,
     body: CrisisVoteCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Cast a vote to activate or deactivate crisis mode. One vote per member."""
-    community = _get_community(db, community_id)
-    require_membership(db, community_id, current_user.id)
+    community, _ = require_member_community(db, community_id, current_user.id)
 
-    # Check for existing vote (replace if different)
-    existing = (
-        db.query(CrisisVote)
-        .filter(
-            CrisisVote.community_id == community_id,
-            CrisisVote.user_id == current_user.id,
-        )
-        .first()
+    # One upsert replaces the SELECT-then-INSERT/UPDATE: a conflicting row is
+    # only updated when the vote actually changes, so no returned row means
+    # the member already voted this way.
+    stmt = dialect_insert(db, CrisisVote).values(
+        community_id=community_id,
+        user_id=current_user.id,
+        vote_type=body.vote_type,
     )
-    if existing:
-        if existing.vote_type == body.vote_type:
-            raise HTTPException(
-                status_code=status.HTTP_409_CONFLICT,
-                detail="You have already voted this way",
-            )
-        existing.vote_type = body.vote_type
-        db.commit()
-        db.refresh(existing)
-        vote = existing
-    else:
-        vote = CrisisVote(
-            community_id=community_id,
-            user_id=current_user.id,
-            vote_type=body.vote_type,
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CrisisVote.community_id, CrisisVote.user_id],
+        set_={"vote_type": stmt.excluded.vote_type},
+        where=CrisisVote.vote_type != stmt.excluded.vote_type,
+    ).returning(CrisisVote.id, CrisisVote.created_at)
+    vote = db.execute(stmt).first()
+    if vote is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="You have already voted this way",
         )
-        db.add(vote)
-        db.commit()
-        db.refresh(vote)
-
-    # Eagerly load user before threshold check (which may delete the vote)
-    _ = vote.user
 
-    # Build response before potential deletion
-    vote_response = CrisisVoteOut.model_validate(vote)
+    # Build response before the threshold check (which may delete the vote)
+    vote_response = CrisisVoteOut(
+        id=vote.id,
+        community_id=community_id,
+        user=current_user,
+        vote_type=body.vote_type,
+        created_at=vote.created_at,
+    )
 
     # Check if threshold is met to auto-switch mode
-    total_members = (
-        db.query(CommunityMember)
-        .filter(CommunityMember.community_id == community_id)
-        .count()
-    )
+    total_members = community.member_count
     target_type = body.vote_type  # activate or deactivate
-    vote_count = (
-        db.query(CrisisVote)
-        .filter(
+    vote_count = db.scalar(
+        select(func.count()).where(
             CrisisVote.community_id == community_id,
             CrisisVote.vote_type == target_type,
         )
-        .count()
     )
 
     threshold_needed = max(1, (total_members * VOTE_THRESHOLD_PCT + 99) // 100)
     if vote_count >= threshold_needed:
         new_mode = "red" if target_type == "activate" else "blue"
-        if community.mode != new_mode:
-            community.mode = new_mode
+        # Compare-and-set: when two votes cross the threshold together, the
+        # row lock makes the second UPDATE re-check the mode and match
+        # nothing, so only one request flips the mode and logs it.
+        switched = db.execute(
+            update(Community)
+            .where(Community.id == community_id, Community.mode != new_mode)
+            .values(mode=new_mode)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if switched:
+            community_name = community.name
             # Clear all votes after mode switch
-            db.query(CrisisVote).filter(
-                CrisisVote.community_id == community_id
-            ).delete()
+            db.execute(
+                delete(CrisisVote)
+                .where(CrisisVote.community_id == community_id)
+                .execution_options(synchronize_session=False)
+            )
             db.commit()
+            crisis_status.invalidate(community_id)
 
             label = "Red Sky (crisis)" if new_mode == "red" else "Blue Sky (normal)"
-            record_activity(
+            background_tasks.add_task(
+                record_activity,
                 db,
                 event_type="crisis_mode_changed",
-                summary=f'community vote switched "{community.name}" to {label}',
+                summary=f'community vote switched "{community_name}" to {label}',
                 actor_id=current_user.id,
                 community_id=community_id,
             )
+            return vote_response
 
+    db.commit()
+    crisis_status.invalidate(community_id)
     return vote_response
 
 
@@ -282,21 +320,21 @@ def retract_crisis_vote(
     db: Session = Depends(get_db),
 ):
     """Retract your crisis mode vote."""
-    _get_community(db, community_id)
-    vote = (
-        db.query(CrisisVote)
-        .filter(
+    require_community(db, community_id)
+    deleted = db.execute(
+        delete(CrisisVote)
+        .where(
             CrisisVote.community_id == community_id,
             CrisisVote.user_id == current_user.id,
         )
-        .first()
-    )
-    if not vote:
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="No vote to retract"
         )
-    db.delete(vote)
     db.commit()
+    crisis_status.invalidate(community_id)
 
 
 # ── Emergency tickets ─────────────────────────────────────────────
@@ -313,8 +351,7 @@ def create_ticket(
     db: Session = Depends(get_db),
 ):
     """Create an emergency ticket (request, offer, or emergency ping)."""
-    community = _get_community(db, community_id)
-    require_membership(db, community_id, current_user.id)
+    community, _ = require_member_community(db, community_id, current_user.id)
 
     # Emergency pings require crisis mode to be active
     if body.ticket_type == "emergency_ping" and community.mode != "red":
@@ -333,12 +370,15 @@ def create_ticket(
         due_at=body.due_at,
     )
     db.add(ticket)
+    # The INSERT returns id and the server-default timestamps, and the author
+    # is the already-loaded current user, so the response needs no reload.
+    db.flush()
+    ticket_out = _ticket_to_out(ticket)
+    community_name = community.name
     db.commit()
-    db.refresh(ticket)
-    _ = ticket.author
-    _ = ticket.assigned_to
 
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="ticket_created",
         summary=f'created {body.ticket_type} ticket "{body.title}"',
@@ -354,13 +394,13 @@ def create_ticket(
             "title": body.title,
             "ticket_type": body.ticket_type,
             "urgency": body.urgency,
-            "community_name": community.name,
+            "community_name": community_name,
         },
         [],
         community_id,
     )
 
-    return _ticket_to_out(ticket)
+    return ticket_out
 
 
 @router.get("/tickets", response_model=EmergencyTicketList)
@@ -376,14 +416,14 @@ def list_tickets(
     db: Session = Depends(get_db),
 ):
     """List emergency tickets for a community."""
-    _get_community(db, community_id)
-    require_membership(db, community_id, current_user.id)
+    require_member_community(db, community_id, current_user.id)
 
     query = (
         db.query(EmergencyTicket)
         .options(
             joinedload(EmergencyTicket.author),
             joinedload(EmergencyTicket.assigned_to),
+            raiseload("*"),
         )
         .filter(EmergencyTicket.community_id == community_id)
     )
@@ -395,18 +435,15 @@ def list_tickets(
     if urgency:
         query = query.filter(EmergencyTicket.urgency == urgency)
 
-    total = query.count()
-
+    # One clock reading orders the page and scores every ticket on it
+    now = datetime.datetime.utcnow()
     if sort == "priority_desc":
-        # Pull all matching tickets and sort in Python using the triage score
-        # (avoids complex SQL expression for the composite score)
-        all_items = query.all()
-        all_items.sort(key=_triage_score, reverse=True)
-        items = all_items[skip: skip + limit]
+        order_by = _triage_order(now)
     else:
-        items = query.order_by(EmergencyTicket.created_at.desc()).offset(skip).limit(limit).all()
+        order_by = (EmergencyTicket.created_at.desc(),)
+    items, total = paginate(query, order_by, skip, limit)
 
-    return EmergencyTicketList(items=[_ticket_to_out(t) for t in items], total=total)
+    return _ticket_list_response(items, total, now)
 
 
 @router.get("/tickets/triage", response_model=EmergencyTicketList)
@@ -421,29 +458,30 @@ def triage_tickets(
     Overdue tickets (due_at < now) receive a +200 escalation bonus.
     Intended for neighbourhood leaders/admins to prioritise response work.
     """
-    _get_community(db, community_id)
-    membership = require_membership(db, community_id, current_user.id)
+    _, role = require_member_community(db, community_id, current_user.id)
 
-    if membership.role not in ("admin", "leader"):
+    if role not in ("admin", "leader"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only leaders and admins can access the triage view",
         )
 
+    now = datetime.datetime.utcnow()
     tickets = (
         db.query(EmergencyTicket)
         .options(
             joinedload(EmergencyTicket.author),
             joinedload(EmergencyTicket.assigned_to),
+            raiseload("*"),
         )
         .filter(
             EmergencyTicket.community_id == community_id,
             EmergencyTicket.status != "resolved",
         )
+        .order_by(*_triage_order(now))
         .all()
     )
-    tickets.sort(key=_triage_score, reverse=True)
-    return EmergencyTicketList(items=[_ticket_to_out(t) for t in tickets], total=len(tickets))
+    return _ticket_list_response(tickets, len(tickets), now)
 
 
 @router.get("/tickets/{ticket_id}", response_model=EmergencyTicketOut)
@@ -454,14 +492,14 @@ def get_ticket(
     db: Session = Depends(get_db),
 ):
     """Get a single emergency ticket."""
-    _get_community(db, community_id)
-    require_membership(db, community_id, current_user.id)
+    require_member_community(db, community_id, current_user.id)
 
     ticket = (
         db.query(EmergencyTicket)
         .options(
             joinedload(EmergencyTicket.author),
             joinedload(EmergencyTicket.assigned_to),
+            raiseload("*"),
         )
         .filter(
             EmergencyTicket.id == ticket_id,
@@ -486,14 +524,14 @@ def update_ticket(
     db: Session = Depends(get_db),
 ):
     """Update a ticket. Author, leaders, or admins can update."""
-    _get_community(db, community_id)
-    membership = require_membership(db, community_id, current_user.id)
+    _, role = require_member_community(db, community_id, current_user.id)
 
     ticket = (
         db.query(EmergencyTicket)
         .options(
             joinedload(EmergencyTicket.author),
             joinedload(EmergencyTicket.assigned_to),
+            raiseload("*"),
         )
         .filter(
             EmergencyTicket.id == ticket_id,
@@ -507,7 +545,7 @@ def update_ticket(
         )
 
     # Only author, leader, or admin can update
-    if ticket.author_id != current_user.id and membership.role not in (
+    if ticket.author_id != current_user.id and role not in (
         "admin",
         "leader",
     ):
@@ -527,22 +565,24 @@ def update_ticket(
     if "due_at" in body.model_fields_set:
         ticket.due_at = body.due_at
     if body.assigned_to_id is not None:
-        # Verify assignee is a member
-        assignee_membership = (
-            db.query(CommunityMember)
-            .filter(
+        # Verify assignee is a member; only the user row is needed
+        assignee = db.scalar(
+            select(User)
+            .join(CommunityMember, CommunityMember.user_id == User.id)
+            .where(
                 CommunityMember.community_id == community_id,
                 CommunityMember.user_id == body.assigned_to_id,
             )
-            .first()
         )
-        if not assignee_membership:
+        if assignee is None:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Assignee must be a community member",
             )
         prev_assigned = ticket.assigned_to_id
-        ticket.assigned_to_id = body.assigned_to_id
+        # Set the relationship (not just the id) so the response shows the
+        # new assignee without reloading the ticket.
+        ticket.assigned_to = assignee
         if body.assigned_to_id and body.assigned_to_id != prev_assigned:
             background_tasks.add_task(
                 dispatch_event,
@@ -552,9 +592,11 @@ def update_ticket(
                 [body.assigned_to_id],
             )
 
+    # eager_defaults: the UPDATE returns the new updated_at
+    db.flush()
+    ticket_out = _ticket_to_out(ticket)
     db.commit()
-    db.refresh(ticket)
-    return _ticket_to_out(ticket)
+    return ticket_out
 
 
 
@@ -569,8 +611,7 @@ def list_ticket_comments(
     db: Session = Depends(get_db),
 ):
     """List comments on an emergency ticket. Any community member can view."""
-    _get_community(db, community_id)
-    require_membership(db, community_id, current_user.id)
+    require_member_community(db, community_id, current_user.id)
 
     ticket = (
         db.query(EmergencyTicket)
@@ -608,8 +649,7 @@ def create_ticket_comment(
     db: Session = Depends(get_db),
 ):
     """Add a comment to an emergency ticket. Any community member can comment."""
-    _get_community(db, community_id)
-    require_membership(db, community_id, current_user.id)
+    require_member_community(db, community_id, current_user.id)
 
     ticket = (
         db.query(EmergencyTicket)
@@ -630,10 +670,10 @@ def create_ticket_comment(
         body=body.body,
     )
     db.add(comment)
+    db.flush()
+    comment_out = TicketCommentOut.model_validate(comment)
     db.commit()
-    db.refresh(comment)
-    _ = comment.author
-    return comment
+    return comment_out
 
 
 # ── Leader management ─────────────────────────────────────────────
@@ -646,12 +686,11 @@ def list_leaders(
     db: Session = Depends(get_db),
 ):
     """List neighbourhood leaders for a community."""
-    _get_community(db, community_id)
-    require_membership(db, community_id, current_user.id)
+    require_member_community(db, community_id, current_user.id)
 
     leaders = (
         db.query(CommunityMember)
-        .options(joinedload(CommunityMember.user))
+        .options(joinedload(CommunityMember.user), raiseload("*"))
         .filter(
             CommunityMember.community_id == community_id,
             CommunityMember.role == "leader",
@@ -668,12 +707,12 @@ def list_leaders(
 def promote_to_leader(
     community_id: int,
     user_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Promote a member to neighbourhood leader. Admin only."""
-    community = _get_community(db, community_id)
-    require_admin(db, community_id, current_user.id)
+    community, _ = require_member_community(db, community_id, current_user.id, admin_only=True)
 
     membership = (
         db.query(CommunityMember)
@@ -701,29 +740,31 @@ def promote_to_leader(
         )
 
     membership.role = "leader"
+    membership_out = CommunityMemberOut.model_validate(membership)
+    display_name, community_name = membership.user.display_name, community.name
     db.commit()
-    db.refresh(membership)
 
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="leader_promoted",
-        summary=f'promoted {membership.user.display_name} to leader in "{community.name}"',
+        summary=f'promoted {display_name} to leader in "{community_name}"',
         actor_id=current_user.id,
         community_id=community_id,
     )
-    return membership
+    return membership_out
 
 
 @router.delete("/leaders/{user_id}", response_model=CommunityMemberOut)
 def demote_leader(
     community_id: int,
     user_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Demote a leader back to regular member. Admin only."""
-    community = _get_community(db, community_id)
-    require_admin(db, community_id, current_user.id)
+    community, _ = require_member_community(db, community_id, current_user.id, admin_only=True)
 
     membership = (
         db.query(CommunityMember)
@@ -746,14 +787,16 @@ def demote_leader(
         )
 
     membership.role = "member"
+    membership_out = CommunityMemberOut.model_validate(membership)
+    display_name, community_name = membership.user.display_name, community.name
     db.commit()
-    db.refresh(membership)
 
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="leader_demoted",
-        summary=f'demoted {membership.user.display_name} from leader in "{community.name}"',
+        summary=f'demoted {display_name} from leader in "{community_name}"',
         actor_id=current_user.id,
         community_id=community_id,
     )
-    return membership
+    return membership_out
@@ -163,7 +163,8 @@ def create_event(
     _ = event.organizer
     _ = event.attendees
 
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="event_created",
         summary=f"created event \"{event.title}\"",
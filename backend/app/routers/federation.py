@@ -1,5 +1,6 @@
 """Federation endpoints – instance directory, Red Sky alerts, data export/import."""
 
+import asyncio
 import datetime
 import ipaddress
 import json
@@ -8,8 +9,10 @@ from urllib.parse import urlparse
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, HttpUrl
+from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -23,11 +26,21 @@ from app.models.resource import Resource
 from app.models.review import Review
 from app.models.skill import Skill
 from app.models.user import User
+from app.services.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/federation", tags=["federation"])
 
+# The directory is polled by every federation heartbeat but only changes via
+# the endpoints below; alerts are polled by every client in Red Sky mode.
+_directory_cache = TTLCache(ttl=60)
+_alerts_cache = TTLCache(ttl=5)
+
+# Upper bound on outgoing federation requests in flight at once (alert
+# deliveries, directory crawls), so a large directory doesn't exhaust sockets.
+_FEDERATION_CONCURRENCY = 32
+
 
 # ── Schemas ─────────────────────────────────────────────────────────
 
@@ -113,10 +126,14 @@ def list_known_instances(
     db: Session = Depends(get_db),
 ):
     """List all known NeighbourGood instances in the directory."""
-    query = db.query(KnownInstance).order_by(KnownInstance.last_seen_at.desc())
-    if reachable_only:
-        query = query.filter(KnownInstance.is_reachable.is_(True))
-    return query.all()
+
+    def _load() -> list[InstanceDirectoryEntry]:
+        query = db.query(KnownInstance).order_by(KnownInstance.last_seen_at.desc())
+        if reachable_only:
+            query = query.filter(KnownInstance.is_reachable.is_(True))
+        return [InstanceDirectoryEntry.model_validate(i) for i in query.all()]
+
+    return _directory_cache.get_or_set(reachable_only, _load)
 
 
 @router.post("/directory", response_model=InstanceDirectoryEntry, status_code=status.HTTP_201_CREATED)
@@ -159,6 +176,7 @@ def add_instance(
     )
     db.add(instance)
     db.commit()
+    _directory_cache.invalidate()
     db.refresh(instance)
     return instance
 
@@ -173,22 +191,42 @@ def remove_instance(
     if current_user.role != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    inst = db.query(KnownInstance).filter(KnownInstance.id == instance_id).first()
+    inst = db.get(KnownInstance, instance_id)
     if not inst:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Instance not found")
     db.delete(inst)
     db.commit()
+    _directory_cache.invalidate()
 
 
 @router.post("/directory/refresh", response_model=list[InstanceDirectoryEntry])
-def refresh_directory(
+async def refresh_directory(
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Re-crawl all known instances to update their metadata and reachability."""
-    instances = db.query(KnownInstance).all()
-    for inst in instances:
-        info = _fetch_instance_info(inst.url)
+    # Database work runs in the threadpool like any sync handler; only the
+    # crawl itself runs on the event loop.
+    instances = await run_in_threadpool(db.query(KnownInstance).all)
+    semaphore = asyncio.Semaphore(_FEDERATION_CONCURRENCY)
+
+    async def _fetch(client: httpx.AsyncClient, url: str) -> dict | None:
+        async with semaphore:
+            return await _fetch_instance_info_async(client, url)
+
+    # One client for the whole crawl so connections are pooled across
+    # instances; the fetches run concurrently.
+    async with httpx.AsyncClient(timeout=10) as client:
+        infos = await asyncio.gather(*(_fetch(client, inst.url) for inst in instances))
+
+    return await run_in_threadpool(_apply_directory_refresh, db, instances, infos)
+
+
+def _apply_directory_refresh(
+    db: Session, instances: list[KnownInstance], infos: list[dict | None]
+) -> list[InstanceDirectoryEntry]:
+    """Store crawled metadata (or unreachability) on each instance and commit."""
+    for inst, info in zip(instances, infos):
         if info:
             inst.name = info.get("name", inst.name)
             inst.description = info.get("description", inst.description)
@@ -207,8 +245,11 @@ def refresh_directory(
         else:
             inst.is_reachable = False
 
+    # Built before commit expires the rows, so the response needs no reload.
+    entries = [InstanceDirectoryEntry.model_validate(inst) for inst in instances]
     db.commit()
-    return instances
+    _directory_cache.invalidate()
+    return entries
 
 
 def _is_safe_url(url: str) -> bool:
@@ -243,6 +284,21 @@ def _fetch_instance_info(base_url: str) -> dict | None:
     return None
 
 
+async def _fetch_instance_info_async(client: httpx.AsyncClient, base_url: str) -> dict | None:
+    """Like :func:`_fetch_instance_info`, but on a shared async client."""
+    # The SSRF check resolves the hostname, which blocks.
+    if not await asyncio.to_thread(_is_safe_url, base_url):
+        logger.warning("Blocked SSRF attempt to internal URL: %s", base_url)
+        return None
+    try:
+        resp = await client.get(f"{base_url}/instance/info")
+        if resp.status_code == 200:
+            return resp.json()
+    except Exception as exc:
+        logger.warning("Failed to reach %s: %s", base_url, exc)
+    return None
+
+
 # ── Cross-Instance Red Sky Alerts ───────────────────────────────────
 
 
@@ -252,14 +308,23 @@ def list_alerts(
     db: Session = Depends(get_db),
 ):
     """List Red Sky alerts received from other instances."""
-    query = db.query(RedSkyAlert).order_by(RedSkyAlert.created_at.desc())
-    if active_only:
-        query = query.filter(RedSkyAlert.is_active.is_(True))
-    return query.all()
+
+    def _load() -> list[AlertOut]:
+        query = db.query(RedSkyAlert).order_by(RedSkyAlert.created_at.desc())
+        if active_only:
+            query = query.filter(RedSkyAlert.is_active.is_(True))
+        return [AlertOut.model_validate(a) for a in query.all()]
+
+    return _alerts_cache.get_or_set(active_only, _load)
+
+
+def _reachable_instance_urls(db: Session) -> list[str]:
+    """URLs of every directory entry last seen reachable."""
+    return list(db.scalars(select(KnownInstance.url).where(KnownInstance.is_reachable.is_(True))))
 
 
 @router.post("/alerts/send", response_model=dict)
-def broadcast_alert(
+async def broadcast_alert(
     body: AlertCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -276,20 +341,26 @@ def broadcast_alert(
         "severity": body.severity,
     }
 
-    instances = db.query(KnownInstance).filter(KnownInstance.is_reachable.is_(True)).all()
-    sent = 0
-    failed = 0
-    for inst in instances:
-        try:
-            resp = httpx.post(f"{inst.url}/federation/alerts/receive", json=payload, timeout=10)
-            if resp.status_code in (200, 201):
-                sent += 1
-            else:
-                failed += 1
-        except Exception:
-            failed += 1
+    # The directory read runs in the threadpool like any sync handler and
+    # finishes before any request goes out; after that the handler only
+    # awaits network I/O, so the wall-clock cost is the slowest instance
+    # rather than the sum over all of them.
+    urls = await run_in_threadpool(_reachable_instance_urls, db)
+    semaphore = asyncio.Semaphore(_FEDERATION_CONCURRENCY)
+
+    async def _send(client: httpx.AsyncClient, url: str) -> bool:
+        async with semaphore:
+            try:
+                resp = await client.post(f"{url}/federation/alerts/receive", json=payload)
+            except Exception:
+                return False
+        return resp.status_code in (200, 201)
+
+    async with httpx.AsyncClient(timeout=10) as client:
+        results = await asyncio.gather(*(_send(client, url) for url in urls))
 
-    return {"sent": sent, "failed": failed, "total": len(instances)}
+    sent = sum(results)
+    return {"sent": sent, "failed": len(urls) - sent, "total": len(urls)}
 
 
 @router.post("/alerts/receive", response_model=AlertOut, status_code=status.HTTP_201_CREATED)
@@ -316,6 +387,7 @@ def receive_alert(body: AlertReceive, db: Session = Depends(get_db)):
     )
     db.add(alert)
     db.commit()
+    _alerts_cache.invalidate()
     db.refresh(alert)
     return alert
 
@@ -330,11 +402,12 @@ def dismiss_alert(
     if current_user.role != "admin":
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin access required")
 
-    alert = db.query(RedSkyAlert).filter(RedSkyAlert.id == alert_id).first()
+    alert = db.get(RedSkyAlert, alert_id)
     if not alert:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Alert not found")
     alert.is_active = False
     db.commit()
+    _alerts_cache.invalidate()
     db.refresh(alert)
     return alert
 
@@ -350,41 +423,72 @@ def export_my_data(
     """Export all of the authenticated user's data as a portable JSON backup."""
     uid = current_user.id
 
-    resources = db.query(Resource).filter(Resource.owner_id == uid).all()
-    bookings = db.query(Booking).filter(Booking.borrower_id == uid).all()
-    skills = db.query(Skill).filter(Skill.owner_id == uid).all()
-    sent_messages = db.query(Message).filter(Message.sender_id == uid).all()
-    received_messages = db.query(Message).filter(Message.recipient_id == uid).all()
-    reviews_given = db.query(Review).filter(Review.reviewer_id == uid).all()
-    reviews_received = db.query(Review).filter(Review.reviewee_id == uid).all()
-
-    memberships = (
-        db.query(CommunityMember)
-        .filter(CommunityMember.user_id == uid)
-        .all()
-    )
-    community_ids = [m.community_id for m in memberships]
-    communities = (
-        db.query(Community)
-        .filter(Community.id.in_(community_ids))
-        .all()
-        if community_ids else []
-    )
+    # Only the serialized columns are read, and each section is one query:
+    # sent and received messages (and given and received reviews) share an
+    # OR filter, and memberships come joined to their community.
+    resources = db.execute(
+        select(
+            Resource.title,
+            Resource.description,
+            Resource.category,
+            Resource.condition,
+            Resource.is_available,
+            Resource.created_at,
+        ).where(Resource.owner_id == uid)
+    ).all()
+    bookings = db.execute(
+        select(
+            Booking.resource_id,
+            Booking.start_date,
+            Booking.end_date,
+            Booking.message,
+            Booking.status,
+            Booking.created_at,
+        ).where(Booking.borrower_id == uid)
+    ).all()
+    skills = db.execute(
+        select(
+            Skill.title,
+            Skill.description,
+            Skill.category,
+            Skill.skill_type,
+            Skill.created_at,
+        ).where(Skill.owner_id == uid)
+    ).all()
+    messages = db.execute(
+        select(Message.sender_id, Message.body, Message.created_at)
+        .where(or_(Message.sender_id == uid, Message.recipient_id == uid))
+        .order_by(Message.created_at, Message.id)
+    ).all()
+    reviews = db.execute(
+        select(Review.reviewer_id, Review.rating, Review.comment, Review.created_at)
+        .where(or_(Review.reviewer_id == uid, Review.reviewee_id == uid))
+        .order_by(Review.created_at, Review.id)
+    ).all()
+    communities = db.execute(
+        select(Community.name, Community.postal_code, Community.city, CommunityMember.role)
+        .join(CommunityMember, CommunityMember.community_id == Community.id)
+        .where(CommunityMember.user_id == uid)
+    ).all()
 
     def _dt(v):
         return v.isoformat() if v else None
 
-    return DataExport(
-        exported_at=datetime.datetime.utcnow().isoformat(),
-        instance=settings.instance_url or settings.instance_name,
-        user={
+    # Every value below is already JSON-native, so the payload goes straight
+    # to json.dumps: returning a DataExport would have FastAPI validate the
+    # whole export, copy it through jsonable_encoder and only then encode it.
+    # The route keeps response_model for the OpenAPI schema.
+    return JSONResponse({
+        "exported_at": datetime.datetime.utcnow().isoformat(),
+        "instance": settings.instance_url or settings.instance_name,
+        "user": {
             "email": current_user.email,
             "display_name": current_user.display_name,
             "neighbourhood": current_user.neighbourhood,
             "role": current_user.role,
             "created_at": _dt(current_user.created_at),
         },
-        resources=[
+        "resources": [
             {
                 "title": r.title,
                 "description": r.description,
@@ -395,7 +499,7 @@ def export_my_data(
             }
             for r in resources
         ],
-        bookings=[
+        "bookings": [
             {
                 "resource_id": b.resource_id,
                 "start_date": str(b.start_date),
@@ -406,7 +510,7 @@ def export_my_data(
             }
             for b in bookings
         ],
-        skills=[
+        "skills": [
             {
                 "title": s.title,
                 "description": s.description,
@@ -416,35 +520,33 @@ def export_my_data(
             }
             for s in skills
         ],
-        messages=[
+        "messages": [
             {
                 "direction": "sent" if m.sender_id == uid else "received",
                 "body": m.body,
                 "created_at": _dt(m.created_at),
             }
-            for m in sent_messages + received_messages
+            for m in messages
         ],
-        reviews=[
+        "reviews": [
             {
                 "role": "reviewer" if r.reviewer_id == uid else "reviewee",
                 "rating": r.rating,
                 "comment": r.comment,
                 "created_at": _dt(r.created_at),
             }
-            for r in reviews_given + reviews_received
+            for r in reviews
         ],
-        communities=[
+        "communities": [
             {
                 "name": c.name,
                 "postal_code": c.postal_code,
                 "city": c.city,
-                "role": next(
-                    (m.role for m in memberships if m.community_id == c.id), "member"
-                ),
+                "role": c.role,
             }
             for c in communities
         ],
-    )
+    })
 
 
 # ── Instance Migration ──────────────────────────────────────────────
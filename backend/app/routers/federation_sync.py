@@ -9,12 +9,16 @@ Endpoints:
 """
 
 import datetime
+import json
 import logging
+from collections.abc import Iterator
 from typing import Optional
 
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.config import settings
@@ -125,7 +129,11 @@ class FederatedSkillOut(BaseModel):
 # ── Public snapshot endpoint (consumed by remote peers) ─────────────────────
 
 
-@router.get("/federation/sync/snapshot", response_model=InstanceSnapshot)
+@router.get(
+    "/federation/sync/snapshot",
+    response_class=StreamingResponse,
+    responses={200: {"model": InstanceSnapshot}},
+)
 def get_sync_snapshot(
     since: Optional[str] = Query(
         None,
@@ -137,7 +145,8 @@ def get_sync_snapshot(
 
     Remote instances call this endpoint during a pull sync. The optional `since`
     parameter enables incremental sync — only items modified after that timestamp
-    are returned, reducing payload size on subsequent pulls.
+    are returned, reducing payload size on subsequent pulls.  A first pull
+    covers every public listing, so the body is streamed rather than built.
     """
     since_dt: Optional[datetime.datetime] = None
     if since:
@@ -151,72 +160,111 @@ def get_sync_snapshot(
                 detail="Invalid `since` timestamp — use ISO-8601 format",
             )
 
-    resource_query = db.query(Resource).filter(Resource.is_available.is_(True))
+    resource_stmt = (
+        select(
+            Resource.id,
+            Resource.title,
+            Resource.description,
+            Resource.category,
+            Resource.condition,
+            Resource.is_available,
+            Resource.created_at,
+            Community.name.label("community_name"),
+            User.display_name.label("owner_display_name"),
+        )
+        .outerjoin(Community, Community.id == Resource.community_id)
+        .outerjoin(User, User.id == Resource.owner_id)
+        .where(Resource.is_available.is_(True))
+    )
+    skill_stmt = (
+        select(
+            Skill.id,
+            Skill.title,
+            Skill.description,
+            Skill.category,
+            Skill.skill_type,
+            Skill.created_at,
+            Community.name.label("community_name"),
+            User.display_name.label("owner_display_name"),
+        )
+        .outerjoin(Community, Community.id == Skill.community_id)
+        .outerjoin(User, User.id == Skill.owner_id)
+    )
     if since_dt:
-        resource_query = resource_query.filter(Resource.updated_at >= since_dt)
-    resources = resource_query.all()
+        resource_stmt = resource_stmt.where(Resource.updated_at >= since_dt)
+        skill_stmt = skill_stmt.where(Skill.updated_at >= since_dt)
+
+    header = {
+        "instance_url": settings.instance_url or "",
+        "instance_name": settings.instance_name or "",
+        "snapshot_at": datetime.datetime.utcnow().isoformat(),
+    }
+    # The request's session may already be closed by the time the body is
+    # iterated, so the stream reads through a session of its own.
+    return StreamingResponse(
+        _stream_snapshot(db.get_bind(), header, resource_stmt, skill_stmt),
+        media_type="application/json",
+    )
+
+
+_SNAPSHOT_CHUNK_ROWS = 500
 
-    skill_query = db.query(Skill)
-    if since_dt:
-        skill_query = skill_query.filter(Skill.updated_at >= since_dt)
-    skills = skill_query.all()
-
-    # Pre-fetch community names to avoid N+1 queries
-    community_ids = set()
-    for r in resources:
-        if r.community_id:
-            community_ids.add(r.community_id)
-    for s in skills:
-        if s.community_id:
-            community_ids.add(s.community_id)
-
-    communities: dict[int, str] = {}
-    if community_ids:
-        for c in db.query(Community).filter(Community.id.in_(community_ids)).all():
-            communities[c.id] = c.name
-
-    # Pre-fetch owner display names
-    user_ids = {r.owner_id for r in resources} | {s.owner_id for s in skills}
-    users: dict[int, str] = {}
-    if user_ids:
-        for u in db.query(User).filter(User.id.in_(user_ids)).all():
-            users[u.id] = u.display_name
+
+def _stream_snapshot(bind, header: dict, resource_stmt, skill_stmt) -> Iterator[bytes]:
+    """Yield an ``InstanceSnapshot`` JSON document piece by piece.
+
+    Rows are fetched ``_SNAPSHOT_CHUNK_ROWS`` at a time and each item is
+    encoded as soon as it is read, so memory stays flat however many public
+    listings the instance has, and peers start receiving bytes immediately.
+    """
 
     def _dt(v: Optional[datetime.datetime]) -> Optional[str]:
         return v.isoformat() if v else None
 
-    return InstanceSnapshot(
-        instance_url=settings.instance_url or "",
-        instance_name=settings.instance_name or "",
-        snapshot_at=datetime.datetime.utcnow().isoformat(),
-        resources=[
-            SnapshotResource(
+    def _array(rows, to_item) -> Iterator[bytes]:
+        yield b"["
+        for i, row in enumerate(rows):
+            if i:
+                yield b","
+            yield to_item(row).model_dump_json().encode()
+        yield b"]"
+
+    with Session(bind) as session:
+        # The envelope is written field by field, so it is well-formed
+        # whatever the header holds – including nothing at all.
+        yield b"{"
+        for key, value in header.items():
+            yield json.dumps(key).encode() + b": " + json.dumps(value).encode() + b", "
+        yield b'"resources": '
+        yield from _array(
+            session.execute(resource_stmt).yield_per(_SNAPSHOT_CHUNK_ROWS),
+            lambda r: SnapshotResource(
                 remote_id=r.id,
                 title=r.title,
                 description=r.description or "",
                 category=r.category,
                 condition=r.condition or "",
-                community_name=communities.get(r.community_id, "") if r.community_id else "",
-                owner_display_name=users.get(r.owner_id, ""),
+                community_name=r.community_name or "",
+                owner_display_name=r.owner_display_name or "",
                 is_available=r.is_available,
                 created_at=_dt(r.created_at),
-            )
-            for r in resources
-        ],
-        skills=[
-            SnapshotSkill(
+            ),
+        )
+        yield b', "skills": '
+        yield from _array(
+            session.execute(skill_stmt).yield_per(_SNAPSHOT_CHUNK_ROWS),
+            lambda s: SnapshotSkill(
                 remote_id=s.id,
                 title=s.title,
                 description=s.description or "",
                 category=s.category,
                 skill_type=s.skill_type,
-                community_name=communities.get(s.community_id, "") if s.community_id else "",
-                owner_display_name=users.get(s.owner_id, ""),
+                community_name=s.community_name or "",
+                owner_display_name=s.owner_display_name or "",
                 created_at=_dt(s.created_at),
-            )
-            for s in skills
-        ],
-    )
+            ),
+        )
+        yield b"}"
 
 
 # ── Admin: trigger pull from all known instances ─────────────────────────────
@@ -3,7 +3,8 @@
 import datetime
 import secrets
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+from sqlalchemy import and_, or_, select, update
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -29,20 +30,21 @@ def create_invite(
     db: Session = Depends(get_db),
 ):
     """Create an invite code for a community (members only)."""
-    # Verify community exists and user is a member
-    community = db.query(Community).filter(Community.id == body.community_id).first()
-    if not community or not community.is_active:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Community not found")
-
-    membership = (
-        db.query(CommunityMember)
-        .filter(
-            CommunityMember.community_id == body.community_id,
-            CommunityMember.user_id == current_user.id,
+    # Community state and the caller's membership in one round-trip
+    row = db.execute(
+        select(Community.is_active, CommunityMember.id.label("membership_id"))
+        .outerjoin(
+            CommunityMember,
+            and_(
+                CommunityMember.community_id == Community.id,
+                CommunityMember.user_id == current_user.id,
+            ),
         )
-        .first()
-    )
-    if not membership:
+        .where(Community.id == body.community_id)
+    ).first()
+    if not row or not row.is_active:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Community not found")
+    if row.membership_id is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You must be a member to create invites",
@@ -98,13 +100,32 @@ def list_invites(
 @router.post("/{code}/redeem", response_model=InviteRedeemResult)
 def redeem_invite(
     code: str,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Redeem an invite code to join a community."""
-    invite = db.query(Invite).filter(Invite.code == code).first()
-    if not invite or not invite.is_active:
+    # The invite, its community and any existing membership in one round-trip
+    row = db.execute(
+        select(
+            Invite,
+            Community.name.label("community_name"),
+            Community.is_active.label("community_active"),
+            CommunityMember.id.label("membership_id"),
+        )
+        .join(Community, Community.id == Invite.community_id)
+        .outerjoin(
+            CommunityMember,
+            and_(
+                CommunityMember.community_id == Invite.community_id,
+                CommunityMember.user_id == current_user.id,
+            ),
+        )
+        .where(Invite.code == code)
+    ).first()
+    if not row or not row.Invite.is_active:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invalid invite code")
+    invite = row.Invite
 
     # Check expiry
     if invite.expires_at and invite.expires_at < datetime.datetime.utcnow():
@@ -114,48 +135,50 @@ def redeem_invite(
     if invite.max_uses is not None and invite.use_count >= invite.max_uses:
         raise HTTPException(status_code=status.HTTP_410_GONE, detail="Invite has been fully used")
 
-    community = db.query(Community).filter(Community.id == invite.community_id).first()
-    if not community or not community.is_active:
+    if not row.community_active:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Community not found")
 
-    # Check if already a member
-    existing = (
-        db.query(CommunityMember)
-        .filter(
-            CommunityMember.community_id == invite.community_id,
-            CommunityMember.user_id == current_user.id,
-        )
-        .first()
-    )
-    if existing:
+    community_id, community_name = invite.community_id, row.community_name
+    if row.membership_id is not None:
         return InviteRedeemResult(
-            community_id=community.id,
-            community_name=community.name,
+            community_id=community_id,
+            community_name=community_name,
             message="You are already a member of this community.",
         )
 
+    # Claim a use with a conditional UPDATE: the check above read a snapshot,
+    # and two redemptions of the last use must not both get through.
+    claimed = db.execute(
+        update(Invite)
+        .where(
+            Invite.id == invite.id,
+            Invite.is_active.is_(True),
+            or_(Invite.max_uses.is_(None), Invite.use_count < Invite.max_uses),
+        )
+        .values(use_count=Invite.use_count + 1)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    if not claimed:
+        db.rollback()
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Invite has been fully used")
+
     # Join the community
-    membership = CommunityMember(
-        community_id=invite.community_id,
-        user_id=current_user.id,
-        role="member",
-    )
-    db.add(membership)
-    invite.use_count += 1
+    db.add(CommunityMember(community_id=community_id, user_id=current_user.id, role="member"))
     db.commit()
 
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="member_joined",
-        summary=f"joined \"{community.name}\" via invite",
+        summary=f"joined \"{community_name}\" via invite",
         actor_id=current_user.id,
-        community_id=community.id,
+        community_id=community_id,
     )
 
     return InviteRedeemResult(
-        community_id=community.id,
-        community_name=community.name,
-        message=f"Welcome to {community.name}!",
+        community_id=community_id,
+        community_name=community_name,
+        message=f"Welcome to {community_name}!",
     )
 
 
@@ -166,7 +189,7 @@ def revoke_invite(
     db: Session = Depends(get_db),
 ):
     """Revoke an invite code (creator or community admin only)."""
-    invite = db.query(Invite).filter(Invite.id == invite_id).first()
+    invite = db.get(Invite, invite_id)
     if not invite:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invite not found")
 
@@ -1,6 +1,6 @@
 """Mesh sync endpoint — ingests messages received via BLE mesh when internet returns."""
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Query, status
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -13,7 +13,9 @@ from app.models.mesh_checkin import MeshCheckin
 from app.models.resource import Resource
 from app.models.user import User
 from app.schemas.mesh import MeshCheckinOut, MeshMessageIn, MeshMetricsIn, MeshSyncRequest, MeshSyncResponse
+from app.services import crisis_status
 from app.services.activity import record_activity
+from app.utils.db import dialect_insert
 
 router = APIRouter(prefix="/mesh", tags=["mesh"])
 
@@ -21,6 +23,7 @@ router = APIRouter(prefix="/mesh", tags=["mesh"])
 @router.post("/sync", response_model=MeshSyncResponse)
 def sync_mesh_messages(
     body: MeshSyncRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -47,7 +50,7 @@ def sync_mesh_messages(
             continue
 
         try:
-            server_object_id = _process_mesh_message(db, msg, current_user)
+            server_object_id = _process_mesh_message(db, msg, current_user, background_tasks)
             # Record as synced
             db.add(
                 MeshSyncedMessage(
@@ -59,6 +62,8 @@ def sync_mesh_messages(
                 )
             )
             db.commit()
+            if msg.type in ("crisis_vote", "crisis_status"):
+                crisis_status.invalidate(msg.community_id)
             synced += 1
         except HTTPException:
             db.rollback()
@@ -71,7 +76,7 @@ def sync_mesh_messages(
 
 
 def _process_mesh_message(
-    db: Session, msg: MeshMessageIn, current_user: User
+    db: Session, msg: MeshMessageIn, current_user: User, background_tasks: BackgroundTasks
 ) -> int | None:
     """Process a single mesh message based on its type. Returns server_object_id if applicable."""
     # Verify community exists
@@ -96,27 +101,28 @@ def _process_mesh_message(
         )
 
     if msg.type == "emergency_ticket":
-        return _sync_emergency_ticket(db, msg, current_user, community)
+        return _sync_emergency_ticket(db, msg, current_user, community, background_tasks)
     elif msg.type == "ticket_comment":
-        return _sync_ticket_comment(db, msg, current_user)
+        return _sync_ticket_comment(db, msg, current_user, background_tasks)
     elif msg.type == "crisis_vote":
         _sync_crisis_vote(db, msg, current_user)
         return None
     elif msg.type == "direct_message":
         return _sync_direct_message(db, msg, current_user)
     elif msg.type == "crisis_status":
-        _sync_crisis_status(db, msg, current_user, community, membership)
+        _sync_crisis_status(db, msg, current_user, community, membership, background_tasks)
         return None
     elif msg.type in ("resource_request", "resource_offer"):
-        return _sync_resource(db, msg, current_user, community)
+        return _sync_resource(db, msg, current_user, community, background_tasks)
     elif msg.type == "location_checkin":
-        return _sync_location_checkin(db, msg, current_user)
+        return _sync_location_checkin(db, msg, current_user, background_tasks)
     # heartbeat: acknowledged but not persisted
     return None
 
 
 def _sync_emergency_ticket(
-    db: Session, msg: MeshMessageIn, user: User, community: Community
+    db: Session, msg: MeshMessageIn, user: User, community: Community,
+    background_tasks: BackgroundTasks,
 ) -> int:
     """Create an emergency ticket from a mesh message. Returns the ticket ID."""
     data = msg.data
@@ -152,7 +158,8 @@ def _sync_emergency_ticket(
     db.add(ticket)
     db.flush()
 
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="ticket_created",
         summary=f'created {ticket_type} ticket "{title}" (via mesh sync)',
@@ -164,7 +171,7 @@ def _sync_emergency_ticket(
 
 
 def _sync_ticket_comment(
-    db: Session, msg: MeshMessageIn, user: User
+    db: Session, msg: MeshMessageIn, user: User, background_tasks: BackgroundTasks
 ) -> int:
     """Create a ticket comment from a mesh message. Returns the comment ID."""
     data = msg.data
@@ -218,7 +225,8 @@ def _sync_ticket_comment(
     db.add(comment)
     db.flush()
 
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="comment_created",
         summary=f"commented on ticket \"{ticket.title}\" (via mesh sync)",
@@ -289,7 +297,7 @@ def _sync_direct_message(
 
 def _sync_crisis_status(
     db: Session, msg: MeshMessageIn, user: User, community: Community,
-    membership: CommunityMember,
+    membership: CommunityMember, background_tasks: BackgroundTasks,
 ) -> None:
     """Update community crisis mode from a mesh message. Leader/admin only."""
     data = msg.data
@@ -313,7 +321,8 @@ def _sync_crisis_status(
     community.mode = new_mode
     db.flush()
 
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="crisis_mode_changed",
         summary=f"switched community to {new_mode} sky mode (via mesh sync)",
@@ -323,7 +332,8 @@ def _sync_crisis_status(
 
 
 def _sync_resource(
-    db: Session, msg: MeshMessageIn, user: User, community: Community
+    db: Session, msg: MeshMessageIn, user: User, community: Community,
+    background_tasks: BackgroundTasks,
 ) -> int:
     """Create a resource listing from a mesh message. Returns the resource ID."""
     data = msg.data
@@ -358,7 +368,8 @@ def _sync_resource(
     db.flush()
 
     action = "shared" if msg.type == "resource_offer" else "requested"
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="resource_created",
         summary=f'{action} resource "{title}" (via mesh sync)',
@@ -370,7 +381,7 @@ def _sync_resource(
 
 
 def _sync_location_checkin(
-    db: Session, msg: MeshMessageIn, user: User
+    db: Session, msg: MeshMessageIn, user: User, background_tasks: BackgroundTasks
 ) -> int:
     """Persist a location check-in from a mesh message. Returns the checkin ID."""
     data = msg.data
@@ -409,7 +420,8 @@ def _sync_location_checkin(
     db.add(checkin)
     db.flush()
 
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="checkin_created",
         summary=f'checked in as "{checkin_status}" (via mesh sync)',
@@ -541,24 +553,16 @@ def _sync_crisis_vote(
             detail="Invalid vote type",
         )
 
-    # Check for existing vote
-    existing = (
-        db.query(CrisisVote)
-        .filter(
-            CrisisVote.community_id == msg.community_id,
-            CrisisVote.user_id == user.id,
-        )
-        .first()
+    # Upsert in one statement; re-sending an unchanged vote is a no-op
+    stmt = dialect_insert(db, CrisisVote).values(
+        community_id=msg.community_id,
+        user_id=user.id,
+        vote_type=vote_type,
     )
-    if existing:
-        if existing.vote_type == vote_type:
-            return  # Same vote already exists, no-op
-        existing.vote_type = vote_type
-    else:
-        vote = CrisisVote(
-            community_id=msg.community_id,
-            user_id=user.id,
-            vote_type=vote_type,
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[CrisisVote.community_id, CrisisVote.user_id],
+            set_={"vote_type": stmt.excluded.vote_type},
+            where=CrisisVote.vote_type != stmt.excluded.vote_type,
         )
-        db.add(vote)
-    db.flush()
+    )
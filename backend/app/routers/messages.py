@@ -4,7 +4,8 @@ Messages are restricted to users who share at least one community.
 """
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
-from sqlalchemy import and_, case, func, or_
+from pydantic import TypeAdapter
+from sqlalchemy import and_, case, func, or_, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
@@ -23,9 +24,12 @@ from app.schemas.message import (
     UnreadCount,
 )
 from app.schemas.user import UserProfile
+from app.utils.db import paginate, user_profile_bundle
 
 router = APIRouter(prefix="/messages", tags=["messages"])
 
+_CONVERSATION_LIST_ADAPTER = TypeAdapter(list[ConversationSummary])
+
 
 def _share_community(db: Session, user_a_id: int, user_b_id: int) -> bool:
     """Return True if user_a and user_b share at least one community."""
@@ -95,8 +99,8 @@ def send_message(
             detail="Cannot send a message to yourself",
         )
 
-    recipient = db.query(User).filter(User.id == body.recipient_id, User.is_active).first()
-    if not recipient:
+    recipient = db.get(User, body.recipient_id)
+    if not recipient or not recipient.is_active:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Recipient not found")
 
     if not _share_community(db, current_user.id, body.recipient_id):
@@ -106,29 +110,32 @@ def send_message(
         )
 
     msg = Message(
-        sender_id=current_user.id,
-        recipient_id=body.recipient_id,
+        sender=current_user,
+        recipient=recipient,
         booking_id=body.booking_id,
         skill_id=body.skill_id,
         body=body.body,
     )
     db.add(msg)
+    # The INSERT returns id and created_at, and both users are already
+    # loaded, so the response is built without a refresh.
+    db.flush()
+    msg_out = MessageOut.model_validate(msg)
+    recipient_email, sender_name = recipient.email, current_user.display_name
     db.commit()
-    db.refresh(msg)
-    _ = msg.sender
-    _ = msg.recipient
-
-    notify_new_message(recipient.email, current_user.display_name)
 
+    # The email goes out over SMTP; like the webhooks, it needn't hold up
+    # the response.
+    background_tasks.add_task(notify_new_message, recipient_email, sender_name)
     background_tasks.add_task(
         dispatch_event,
         db,
         "message.new",
-        {"sender_name": current_user.display_name},
+        {"sender_name": sender_name},
         [body.recipient_id],
     )
 
-    return msg
+    return msg_out
 
 
 @router.get("", response_model=MessageList)
@@ -166,8 +173,7 @@ def list_messages(
     if skill_id is not None:
         query = query.filter(Message.skill_id == skill_id)
 
-    total = query.count()
-    items = query.order_by(Message.created_at.desc()).offset(skip).limit(limit).all()
+    items, total = paginate(query, (Message.created_at.desc(),), skip, limit)
     return MessageList(items=items, total=total)
 
 
@@ -177,75 +183,43 @@ def list_conversations(
     db: Session = Depends(get_db),
 ):
     """List all conversation partners with the last message and unread count."""
-    # Get the partner ID for each message (the other user)
-    partner_id_col = case(
-        (Message.sender_id == current_user.id, Message.recipient_id),
+    uid = current_user.id
+    # The other user in each message
+    partner_id = case(
+        (Message.sender_id == uid, Message.recipient_id),
         else_=Message.sender_id,
-    ).label("partner_id")
-
-    # Subquery: get distinct partner IDs
-    partner_subq = (
-        db.query(partner_id_col)
-        .filter(
-            or_(
-                Message.sender_id == current_user.id,
-                Message.recipient_id == current_user.id,
+    )
+    # One pass over the user's messages: rank each conversation newest first
+    # and total its unread messages alongside, so the latest row carries both.
+    ranked = (
+        select(
+            partner_id.label("partner_id"),
+            Message.body,
+            Message.created_at,
+            func.row_number()
+            .over(partition_by=partner_id, order_by=(Message.created_at.desc(), Message.id.desc()))
+            .label("rn"),
+            func.sum(
+                case((and_(Message.recipient_id == uid, Message.is_read.is_(False)), 1), else_=0)
             )
+            .over(partition_by=partner_id)
+            .label("unread_count"),
         )
-        .distinct()
+        .where(or_(Message.sender_id == uid, Message.recipient_id == uid))
         .subquery()
     )
-
-    partner_ids = [row[0] for row in db.query(partner_subq.c.partner_id).all()]
-    if not partner_ids:
-        return []
-
-    # Bulk-fetch all partners in one query (fixes N+1)
-    partners = db.query(User).filter(User.id.in_(partner_ids)).all()
-    partner_map = {p.id: p for p in partners}
-
-    conversations = []
-    for pid in partner_ids:
-        partner = partner_map.get(pid)
-        if not partner:
-            continue
-
-        # Last message in this conversation
-        last_msg = (
-            db.query(Message)
-            .filter(
-                or_(
-                    and_(Message.sender_id == current_user.id, Message.recipient_id == pid),
-                    and_(Message.sender_id == pid, Message.recipient_id == current_user.id),
-                )
-            )
-            .order_by(Message.created_at.desc())
-            .first()
+    rows = db.execute(
+        select(
+            user_profile_bundle("partner"),
+            ranked.c.body.label("last_message_body"),
+            ranked.c.created_at.label("last_message_at"),
+            ranked.c.unread_count,
         )
-
-        # Count unread from this partner
-        unread = (
-            db.query(func.count(Message.id))
-            .filter(
-                Message.sender_id == pid,
-                Message.recipient_id == current_user.id,
-                Message.is_read == False,  # noqa: E712
-            )
-            .scalar()
-        )
-
-        if last_msg:
-            conversations.append(
-                ConversationSummary(
-                    partner=partner,
-                    last_message_body=last_msg.body,
-                    last_message_at=last_msg.created_at,
-                    unread_count=unread or 0,
-                )
-            )
-
-    conversations.sort(key=lambda c: c.last_message_at, reverse=True)
-    return conversations
+        .join_from(ranked, User, User.id == ranked.c.partner_id)
+        .where(ranked.c.rn == 1)
+        .order_by(ranked.c.created_at.desc())
+    ).all()
+    return _CONVERSATION_LIST_ADAPTER.validate_python(rows, from_attributes=True)
 
 
 @router.get("/unread", response_model=UnreadCount)
@@ -254,15 +228,16 @@ def get_unread_count(
     db: Session = Depends(get_db),
 ):
     """Get the total number of unread messages for the current user."""
-    count = (
-        db.query(func.count(Message.id))
-        .filter(
+    # COUNT(*) over the partial unread index needs no table lookups.
+    count = db.scalar(
+        select(func.count())
+        .select_from(Message)
+        .where(
             Message.recipient_id == current_user.id,
             Message.is_read == False,  # noqa: E712
         )
-        .scalar()
     )
-    return UnreadCount(count=count or 0)
+    return UnreadCount(count=count)
 
 
 @router.patch("/{message_id}/read", response_model=MessageOut)
@@ -272,11 +247,8 @@ def mark_as_read(
     db: Session = Depends(get_db),
 ):
     """Mark a message as read (recipient only)."""
-    msg = (
-        db.query(Message)
-        .options(joinedload(Message.sender), joinedload(Message.recipient))
-        .filter(Message.id == message_id)
-        .first()
+    msg = db.get(
+        Message, message_id, options=[joinedload(Message.sender), joinedload(Message.recipient)]
     )
     if not msg:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Message not found")
@@ -296,10 +268,11 @@ def mark_conversation_read(
     db: Session = Depends(get_db),
 ):
     """Mark all messages from a partner as read."""
+    # No Message objects are loaded here, so skip syncing the identity map.
     db.query(Message).filter(
         Message.sender_id == partner_id,
         Message.recipient_id == current_user.id,
         Message.is_read == False,  # noqa: E712
-    ).update({"is_read": True})
+    ).update({"is_read": True}, synchronize_session=False)
     db.commit()
     return {"ok": True}
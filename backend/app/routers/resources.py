@@ -18,6 +18,7 @@ from app.models.user import User
 from app.services.activity import record_activity
 from app.services.file_upload import ALLOWED_EXTENSIONS, ALLOWED_IMAGE_TYPES, validate_image_magic
 from app.services.webhooks import dispatch_event
+from app.utils.db import paginate
 from app.schemas.resource import (
     CATEGORY_META,
     VALID_CATEGORIES,
@@ -117,8 +118,7 @@ def list_resources(
             )
         )
 
-    total = query.count()
-    items = query.order_by(Resource.created_at.desc()).offset(skip).limit(limit).all()
+    items, total = paginate(query, (Resource.created_at.desc(),), skip, limit)
     return ResourceList(
         items=[ResourceOut(**_resource_to_out(r)) for r in items],
         total=total,
@@ -159,7 +159,8 @@ def create_resource(
     db.commit()
     db.refresh(resource)
     _ = resource.owner
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type="resource_shared",
         summary=f"shared \"{resource.title}\"",
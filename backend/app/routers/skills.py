@@ -11,6 +11,7 @@ from app.models.skill import Skill
 from app.models.user import User
 from app.services.activity import record_activity
 from app.services.webhooks import dispatch_event
+from app.utils.db import paginate
 from app.schemas.skill import (
     SKILL_CATEGORY_META,
     VALID_SKILL_CATEGORIES,
@@ -99,8 +100,7 @@ def list_skills(
             )
         )
 
-    total = query.count()
-    items = query.order_by(Skill.created_at.desc()).offset(skip).limit(limit).all()
+    items, total = paginate(query, (Skill.created_at.desc(),), skip, limit)
     return SkillList(
         items=[SkillOut(**_skill_to_out(s)) for s in items],
         total=total,
@@ -140,7 +140,8 @@ def create_skill(
     _ = skill.owner
     event_type = "skill_offered" if skill.skill_type == "offer" else "skill_requested"
     verb = "offered" if skill.skill_type == "offer" else "is looking for"
-    record_activity(
+    background_tasks.add_task(
+        record_activity,
         db,
         event_type=event_type,
         summary=f"{verb} \"{skill.title}\"",
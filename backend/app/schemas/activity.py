@@ -21,4 +21,6 @@ class ActivityOut(BaseModel):
 
 class ActivityList(BaseModel):
     items: list[ActivityOut]
-    total: int
+    total: int | None = None  # only computed when ?include_total=true
+    has_more: bool = False
+    next_cursor: str | None = None  # pass as ?cursor= to fetch the next page
@@ -22,5 +22,4 @@ def record_activity(
     )
     db.add(event)
     db.commit()
-    db.refresh(event)
     return event
@@ -9,12 +9,17 @@ import hashlib
 import hmac
 import json
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
 from passlib.context import CryptContext
 
 from app.config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hashes carry their own cost, so changing NG_BCRYPT_ROUNDS only affects newly
+# hashed passwords; existing ones verify at the cost they were created with.
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.bcrypt_rounds
+)
 
 
 def hash_password(password: str) -> str:
@@ -37,19 +42,33 @@ def _b64url_decode(s: str) -> bytes:
     return base64.urlsafe_b64decode(s + "=" * padding)
 
 
+# Every token we issue carries the same header, so encode it once
+_HEADER = _b64url_encode(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+
+
+@lru_cache(maxsize=1)
+def _signing_key(secret: str) -> bytes:
+    """Return the HMAC key bytes for *secret*, encoding it only once."""
+    return secret.encode()
+
+
+def _sign(signing_input: str) -> str:
+    return _b64url_encode(
+        hmac.new(
+            _signing_key(settings.secret_key),
+            signing_input.encode(),
+            hashlib.sha256,
+        ).digest()
+    )
+
+
 def create_access_token(user_id: int) -> str:
-    header = _b64url_encode(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    header = _HEADER
     expire = datetime.now(timezone.utc) + timedelta(minutes=settings.access_token_expire_minutes)
     payload = _b64url_encode(
         json.dumps({"sub": str(user_id), "exp": int(expire.timestamp())}).encode()
     )
-    signature = _b64url_encode(
-        hmac.new(
-            settings.secret_key.encode(),
-            f"{header}.{payload}".encode(),
-            hashlib.sha256,
-        ).digest()
-    )
+    signature = _sign(f"{header}.{payload}")
     return f"{header}.{payload}.{signature}"
 
 
@@ -62,17 +81,13 @@ def decode_access_token(token: str) -> int | None:
         header, payload, signature = parts
 
         # Verify algorithm header to prevent algorithm confusion attacks
-        header_data = json.loads(_b64url_decode(header))
-        if header_data.get("alg") != "HS256":
-            return None
+        # (our own header is already known to be HS256 – skip the JSON parse)
+        if header != _HEADER:
+            header_data = json.loads(_b64url_decode(header))
+            if header_data.get("alg") != "HS256":
+                return None
 
-        expected = _b64url_encode(
-            hmac.new(
-                settings.secret_key.encode(),
-                f"{header}.{payload}".encode(),
-                hashlib.sha256,
-            ).digest()
-        )
+        expected = _sign(f"{header}.{payload}")
         if not hmac.compare_digest(signature, expected):
             return None
 
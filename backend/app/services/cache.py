@@ -0,0 +1,92 @@
+"""Small in-process read-through cache with per-entry expiry.
+
+Used for hot, rarely-changing lists that every client polls.  Entries live
+in this worker's memory only, so each write path that changes the cached
+data must call :meth:`TTLCache.invalidate`; other workers converge once
+their entries expire, which bounds staleness to the TTL.
+
+Expired entries are swept out by stores (at most once per TTL), and each
+cache holds at most ``maxsize`` entries, so keys that are never read again
+(e.g. arbitrary months on a public calendar) can't accumulate.
+"""
+
+import time
+from collections.abc import Callable, Hashable
+from threading import Lock
+from typing import Any
+
+_caches: list["TTLCache"] = []
+
+
+class TTLCache:
+    """A dict of ``key → value`` where each value expires *ttl* seconds after it was stored.
+
+    Once *maxsize* live entries are held, storing another evicts the oldest.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = Lock()
+        # key → (monotonic expiry, value)
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+        # Bumped by invalidate() so a load that raced a write isn't stored.
+        self._generation = 0
+        # Expired entries are swept out at most once per TTL, on a store.
+        self._next_sweep = 0.0
+        _caches.append(self)
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for *key*, calling *loader* to fill a miss.
+
+        The loader runs outside the lock; two concurrent misses may both load,
+        which is harmless for idempotent reads.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            generation = self._generation
+
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                now = time.monotonic()
+                self._entries.pop(key, None)
+                self._evict(now)
+                self._entries[key] = (now + self.ttl, value)
+        return value
+
+    def _evict(self, now: float) -> None:
+        """Make room for one more entry, sweeping expired ones when due.
+
+        Called with the lock held.  Entries are stored in insertion order with
+        the same TTL, so the front of the dict is always the oldest.
+        """
+        if now >= self._next_sweep or len(self._entries) >= self.maxsize:
+            for key in [k for k, (expiry, _) in self._entries.items() if expiry <= now]:
+                del self._entries[key]
+            self._next_sweep = now + self.ttl
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, match: Callable[[Hashable], bool] | None = None) -> None:
+        """Drop every entry, or only those whose key satisfies *match*.
+
+        Called after a write to the underlying table.  In-flight loads are
+        discarded either way, since they may have read the old data.
+        """
+        with self._lock:
+            if match is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if match(k)]:
+                    del self._entries[key]
+            self._generation += 1
+
+
+def clear_all() -> None:
+    """Empty every cache in the process (used between tests)."""
+    for cache in _caches:
+        cache.invalidate()
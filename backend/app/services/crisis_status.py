@@ -0,0 +1,28 @@
+"""Short-lived cache of ``/crisis/status`` responses, keyed by community id.
+
+Clients poll the status every few seconds during a Red Sky event.  Every
+write to a community's mode or votes calls :func:`invalidate` after
+committing, so this worker never serves a stale count; other workers
+converge within ``STATUS_TTL`` seconds.
+"""
+
+from collections.abc import Callable
+from typing import TypeVar
+
+from app.services.cache import TTLCache
+
+STATUS_TTL = 3
+
+_status_cache = TTLCache(STATUS_TTL)
+
+T = TypeVar("T")
+
+
+def get_or_load(community_id: int, loader: Callable[[], T]) -> T:
+    """Return the cached status for *community_id*, calling *loader* on a miss."""
+    return _status_cache.get_or_set(community_id, loader)
+
+
+def invalidate(community_id: int) -> None:
+    """Drop *community_id*'s cached status after its mode or votes changed."""
+    _status_cache.invalidate(lambda key: key == community_id)
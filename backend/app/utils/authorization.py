@@ -1,54 +1,44 @@
 """Shared authorization helpers for route handlers."""
 
 from fastapi import HTTPException
+from sqlalchemy import and_, select
+from sqlalchemy.orm import Session
 
 from app.models.community import Community, CommunityMember
-from app.models.user import User
-from sqlalchemy.orm import Session
 
 
 def require_community(db: Session, community_id: int) -> Community:
-    """Return the community or raise 404."""
-    community = db.query(Community).filter(Community.id == community_id).first()
-    if not community:
+    """Return the active community or raise 404."""
+    community = db.get(Community, community_id)
+    if not community or not community.is_active:
         raise HTTPException(status_code=404, detail="Community not found")
     return community
 
 
-def require_membership(
-    db: Session, community_id: int, user_id: int
-) -> CommunityMember:
-    """Return the membership record or raise 403."""
-    member = (
-        db.query(CommunityMember)
-        .filter(
-            CommunityMember.community_id == community_id,
-            CommunityMember.user_id == user_id,
+def require_member_community(
+    db: Session, community_id: int, user_id: int, *, admin_only: bool = False
+) -> tuple[Community, str]:
+    """Return the community and *user_id*'s role in it with one query.
+
+    Raises 404 for a missing or inactive community, then 403 for a
+    non-member – or, with *admin_only*, for a member who isn't an admin.
+    Callers needing other roles check the returned role themselves.
+    """
+    row = db.execute(
+        select(Community, CommunityMember.role)
+        .outerjoin(
+            CommunityMember,
+            and_(
+                CommunityMember.community_id == Community.id,
+                CommunityMember.user_id == user_id,
+            ),
         )
-        .first()
-    )
-    if not member:
+        .where(Community.id == community_id)
+    ).first()
+    if not row or not row.Community.is_active:
+        raise HTTPException(status_code=404, detail="Community not found")
+    if row.role is None:
         raise HTTPException(status_code=403, detail="Not a member of this community")
-    return member
-
-
-def require_admin(
-    db: Session, community_id: int, user_id: int
-) -> CommunityMember:
-    """Return the membership record if user is admin, else raise 403."""
-    member = require_membership(db, community_id, user_id)
-    if member.role != "admin":
+    if admin_only and row.role != "admin":
         raise HTTPException(status_code=403, detail="Admin access required")
-    return member
-
-
-def require_admin_or_leader(
-    db: Session, community_id: int, user_id: int
-) -> CommunityMember:
-    """Return the membership record if user is admin or leader, else raise 403."""
-    member = require_membership(db, community_id, user_id)
-    if member.role not in ("admin", "leader"):
-        raise HTTPException(
-            status_code=403, detail="Admin or leader access required"
-        )
-    return member
+    return row.Community, row.role
@@ -1,11 +1,14 @@
 """Database utility helpers for route handlers."""
 
-from typing import Type, TypeVar
+from typing import Any, Type, TypeVar
 
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, Select, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Bundle, Query, Session
 
 from app.database import Base
+from app.models.user import User
 
 T = TypeVar("T", bound=Base)
 
@@ -18,3 +21,73 @@ def get_or_404(db: Session, model: Type[T], id: int) -> T:
             status_code=404, detail=f"{model.__name__} not found"
         )
     return obj
+
+
+def dialect_insert(db: Session, model: Type[T]) -> postgresql.Insert | sqlite.Insert:
+    """An ``INSERT`` for the session's dialect, supporting ``on_conflict_do_*``.
+
+    Both PostgreSQL and SQLite implement ``INSERT ... ON CONFLICT``; only
+    the construct has to come from the matching dialect module.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+def paginate(query: Query, order_by: tuple[Any, ...], skip: int, limit: int) -> tuple[list, int]:
+    """Return one ``(items, total)`` page of *query* in a single round-trip.
+
+    The total rides along on every row as ``COUNT(*) OVER ()`` instead of a
+    separate ``query.count()`` re-running the same filters.  Only a page past
+    the end (no rows to carry it) falls back to counting.  Not for queries
+    that joinedload a collection, whose joined rows would be counted.
+    """
+    rows = (
+        query.add_columns(func.count().over())
+        .order_by(*order_by)
+        .offset(skip)
+        .limit(limit)
+        .all()
+    )
+    if rows:
+        return [row[0] for row in rows], rows[0][1]
+    return [], query.count() if skip else 0
+
+
+def paginate_rows(db: Session, stmt: Select, order_by: tuple[Any, ...], skip: int, limit: int) -> tuple[list[Row], int]:
+    """Like :func:`paginate`, for a Core ``select()`` of plain columns.
+
+    Rows carry an extra ``total_count`` column; schemas validating them with
+    ``from_attributes`` ignore it.
+    """
+    rows = db.execute(
+        stmt.add_columns(func.count().over().label("total_count"))
+        .order_by(*order_by)
+        .offset(skip)
+        .limit(limit)
+    ).all()
+    if rows:
+        return rows, rows[0].total_count
+    if not skip:
+        return [], 0
+    return [], db.scalar(select(func.count()).select_from(stmt.subquery()))
+
+
+def user_profile_bundle(name: str) -> Bundle:
+    """The ``UserProfile`` columns of ``users``, nested under *name* in each row.
+
+    Lets list endpoints read a related user as part of a column select
+    instead of hydrating ``User`` objects – and skips hashed_password and
+    the (up to 2 kB) mesh_public_key.
+    """
+    return Bundle(
+        name,
+        User.id,
+        User.email,
+        User.display_name,
+        User.neighbourhood,
+        User.role,
+        User.telegram_chat_id,
+        User.language_code,
+        User.created_at,
+    )
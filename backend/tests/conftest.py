@@ -1,18 +1,22 @@
 """Shared fixtures for tests – uses an in-memory SQLite database."""
 
 import os
+from contextlib import contextmanager
 
 # Enable debug mode so the default secret key is accepted during tests.
 os.environ.setdefault("NG_DEBUG", "true")
+# Minimum bcrypt cost – the tests exercise auth flows, not hash strength.
+os.environ.setdefault("NG_BCRYPT_ROUNDS", "4")
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.database import Base, get_db
 from app.main import app
+from app.services import cache
 
 TEST_DATABASE_URL = "sqlite://"
 
@@ -29,6 +33,7 @@ def setup_db():
     Base.metadata.create_all(bind=engine)
     yield
     Base.metadata.drop_all(bind=engine)
+    cache.clear_all()
 
 
 @pytest.fixture()
@@ -40,6 +45,24 @@ def db():
         session.close()
 
 
+@pytest.fixture()
+def count_queries():
+    """Return a context manager collecting the SQL statements run inside it."""
+    @contextmanager
+    def _count():
+        statements: list[str] = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", _record)
+    return _count
+
+
 @pytest.fixture()
 def client(db):
     def _override():
@@ -1,5 +1,9 @@
 """Tests for community activity feed endpoints."""
 
+from sqlalchemy import delete
+
+from app.models.activity import Activity
+
 
 def _register(client, email, name="User"):
     res = client.post(
@@ -23,11 +27,12 @@ def _create_community(client, headers, name="Test Community"):
 
 def test_empty_feed(client):
     """Empty feed returns zero items."""
-    res = client.get("/activity")
+    res = client.get("/activity?include_total=true")
     assert res.status_code == 200
     data = res.json()
     assert data["items"] == []
     assert data["total"] == 0
+    assert data["has_more"] is False
 
 
 def test_resource_creates_activity(client, auth_headers, community_id):
@@ -37,7 +42,7 @@ def test_resource_creates_activity(client, auth_headers, community_id):
         headers=auth_headers,
         json={"title": "Drill", "category": "tool", "community_id": community_id},
     )
-    res = client.get("/activity")
+    res = client.get("/activity?include_total=true")
     data = res.json()
     assert data["total"] == 1
     assert data["items"][0]["event_type"] == "resource_shared"
@@ -148,7 +153,7 @@ def test_filter_by_community(client, auth_headers):
         json={"title": "Personal Saw", "category": "tool", "community_id": second_community_id},
     )
 
-    all_activity = client.get("/activity")
+    all_activity = client.get("/activity?include_total=true")
     assert all_activity.json()["total"] >= 2
 
     community_activity = client.get(f"/activity?community_id={community_id}")
@@ -182,3 +187,75 @@ def test_my_activity_requires_auth(client):
     """The /my endpoint requires authentication."""
     res = client.get("/activity/my")
     assert res.status_code == 403
+
+
+# ── Pagination ─────────────────────────────────────────────────────
+
+
+def test_feed_total_is_opt_in(client, auth_headers, community_id):
+    """Without include_total the COUNT is skipped and total is null."""
+    res = client.get("/activity")
+    assert res.status_code == 200
+    assert res.json()["total"] is None
+
+
+def test_feed_cursor_pagination(client, auth_headers, community_id):
+    """next_cursor walks the feed newest-first without gaps or repeats."""
+    for i in range(5):
+        client.post(
+            "/resources", headers=auth_headers,
+            json={"title": f"Tool {i}", "category": "tool", "community_id": community_id},
+        )
+    everything = client.get("/activity?limit=100").json()["items"]
+
+    seen, cursor = [], None
+    while True:
+        url = "/activity?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        page = client.get(url).json()
+        seen.extend(e["id"] for e in page["items"])
+        if not page["has_more"]:
+            assert page["next_cursor"] is None
+            break
+        assert len(page["items"]) == 2
+        cursor = page["next_cursor"]
+
+    assert seen == [e["id"] for e in everything]
+
+
+def test_feed_invalid_cursor(client):
+    res = client.get("/activity?cursor=not-a-cursor!")
+    assert res.status_code == 400
+
+
+def test_feed_cursor_row_deleted(client, auth_headers, community_id, db):
+    """A cursor pointing at a deleted row is a 400, not an empty last page."""
+    for i in range(3):
+        client.post(
+            "/resources", headers=auth_headers,
+            json={"title": f"Tool {i}", "category": "tool", "community_id": community_id},
+        )
+    page = client.get("/activity?limit=1").json()
+    db.execute(delete(Activity).where(Activity.id == page["items"][0]["id"]))
+    db.commit()
+
+    res = client.get(f"/activity?cursor={page['next_cursor']}")
+    assert res.status_code == 400
+
+
+def test_feed_deprecated_skip_still_pages(client, auth_headers, community_id):
+    """Offset clients keep working: skip pages the feed and total is counted."""
+    for i in range(3):
+        client.post(
+            "/resources", headers=auth_headers,
+            json={"title": f"Tool {i}", "category": "tool", "community_id": community_id},
+        )
+    everything = client.get("/activity?limit=100").json()["items"]
+
+    page = client.get("/activity?skip=1&limit=2").json()
+    assert [e["id"] for e in page["items"]] == [e["id"] for e in everything[1:3]]
+    assert page["total"] == len(everything)
+
+
+def test_feed_skip_and_cursor_conflict(client):
+    res = client.get("/activity?skip=1&cursor=MQ")
+    assert res.status_code == 422
@@ -231,6 +231,28 @@ def test_list_bookings_as_borrower(client, auth_headers):
     assert data["items"][0]["resource_title"] == "Shared Drill"
 
 
+def test_list_bookings_keeps_booking_of_deleted_resource(client, auth_headers, db):
+    from sqlalchemy import delete
+
+    from app.models.resource import Resource
+
+    cid = _create_community(client, auth_headers)
+    borrower_headers = _register(client, "borrower@test.com", "Borrower")
+    resource_id = _create_resource(client, auth_headers, cid)
+    booking_id = client.post(
+        "/bookings",
+        headers=borrower_headers,
+        json={"resource_id": resource_id, "start_date": "2026-03-01", "end_date": "2026-03-05"},
+    ).json()["id"]
+    db.execute(delete(Resource).where(Resource.id == resource_id))
+    db.commit()
+
+    res = client.get("/bookings?role=borrower", headers=borrower_headers)
+    assert res.json()["total"] == 1
+    assert res.json()["items"][0]["id"] == booking_id
+    assert res.json()["items"][0]["resource_title"] is None
+
+
 def test_list_bookings_as_owner(client, auth_headers):
     cid = _create_community(client, auth_headers)
     borrower_headers = _register(client, "borrower@test.com", "Borrower")
@@ -553,6 +575,29 @@ def test_calendar_excludes_cancelled(client, auth_headers):
     assert len(res.json()) == 0
 
 
+def test_calendar_reflects_writes_after_cached_read(client, auth_headers):
+    cid = _create_community(client, auth_headers)
+    borrower_headers = _register(client, "borrower@test.com", "Borrower")
+    resource_id = _create_resource(client, auth_headers, cid)
+    url = f"/bookings/resource/{resource_id}/calendar?month=3&year=2026"
+
+    assert client.get(url).json() == []  # cached empty
+
+    create_res = client.post(
+        "/bookings",
+        headers=borrower_headers,
+        json={"resource_id": resource_id, "start_date": "2026-03-10", "end_date": "2026-03-15"},
+    )
+    assert len(client.get(url).json()) == 1
+
+    client.patch(
+        f"/bookings/{create_res.json()['id']}",
+        headers=borrower_headers,
+        json={"status": "cancelled"},
+    )
+    assert client.get(url).json() == []
+
+
 def test_calendar_different_month(client, auth_headers):
     cid = _create_community(client, auth_headers)
     borrower_headers = _register(client, "borrower@test.com", "Borrower")
@@ -572,3 +617,18 @@ def test_calendar_different_month(client, auth_headers):
     res = client.get(f"/bookings/resource/{resource_id}/calendar?month=4&year=2026")
     assert res.status_code == 200
     assert len(res.json()) == 0
+
+
+def test_only_exclusion_violations_count_as_overlap():
+    """A lost overlap race is a 409; other constraint failures propagate."""
+    from sqlalchemy.exc import IntegrityError
+
+    from app.routers.bookings import _is_overlap_violation
+
+    class _PgError(Exception):
+        def __init__(self, pgcode):
+            self.pgcode = pgcode
+
+    assert _is_overlap_violation(IntegrityError("INSERT", {}, _PgError("23P01")))
+    assert not _is_overlap_violation(IntegrityError("INSERT", {}, _PgError("23503")))
+    assert not _is_overlap_violation(IntegrityError("INSERT", {}, Exception("NOT NULL")))
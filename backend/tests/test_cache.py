@@ -0,0 +1,67 @@
+"""Tests for the in-process TTL cache."""
+
+from unittest.mock import patch
+
+from app.services.cache import TTLCache
+
+
+def test_get_or_set_loads_once_within_ttl():
+    cache = TTLCache(ttl=60)
+    calls = []
+    assert cache.get_or_set("k", lambda: calls.append(1) or "v") == "v"
+    assert cache.get_or_set("k", lambda: calls.append(1) or "other") == "v"
+    assert len(calls) == 1
+
+
+def test_entry_expires_after_ttl():
+    cache = TTLCache(ttl=5)
+    with patch("app.services.cache.time.monotonic", return_value=100.0):
+        cache.get_or_set("k", lambda: "old")
+    with patch("app.services.cache.time.monotonic", return_value=106.0):
+        assert cache.get_or_set("k", lambda: "new") == "new"
+
+
+def test_invalidate_drops_entries():
+    cache = TTLCache(ttl=60)
+    cache.get_or_set("k", lambda: "old")
+    cache.invalidate()
+    assert cache.get_or_set("k", lambda: "new") == "new"
+
+
+def test_invalidate_with_match_keeps_other_keys():
+    cache = TTLCache(ttl=60)
+    cache.get_or_set((1, "a"), lambda: "one")
+    cache.get_or_set((2, "a"), lambda: "two")
+    cache.invalidate(lambda key: key[0] == 1)
+    assert cache.get_or_set((1, "a"), lambda: "new") == "new"
+    assert cache.get_or_set((2, "a"), lambda: "new") == "two"
+
+
+def test_load_racing_invalidate_is_not_stored():
+    cache = TTLCache(ttl=60)
+
+    def _load():
+        cache.invalidate()  # a write lands while the read is in flight
+        return "stale"
+
+    assert cache.get_or_set("k", _load) == "stale"
+    assert cache.get_or_set("k", lambda: "fresh") == "fresh"
+
+
+def test_store_sweeps_expired_keys():
+    cache = TTLCache(ttl=5)
+    with patch("app.services.cache.time.monotonic", return_value=100.0):
+        for month in range(1, 13):
+            cache.get_or_set((1, 2099, month), lambda: "cal")
+    with patch("app.services.cache.time.monotonic", return_value=106.0):
+        cache.get_or_set((2, 2099, 1), lambda: "cal")
+    assert list(cache._entries) == [(2, 2099, 1)]
+
+
+def test_maxsize_evicts_oldest_entry():
+    cache = TTLCache(ttl=60, maxsize=2)
+    cache.get_or_set("a", lambda: 1)
+    cache.get_or_set("b", lambda: 2)
+    cache.get_or_set("c", lambda: 3)
+    assert list(cache._entries) == ["b", "c"]
+    assert cache.get_or_set("a", lambda: "reloaded") == "reloaded"
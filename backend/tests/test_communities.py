@@ -136,6 +136,18 @@ def test_leave_community(client, auth_headers):
     assert res.status_code == 204
 
 
+def test_member_count_follows_join_and_leave(client, auth_headers):
+    created = _create_community(client, auth_headers)
+    cid = created["id"]
+    other = _register(client, "counter@test.com", "Counter")
+
+    client.post(f"/communities/{cid}/join", headers=other)
+    assert client.get(f"/communities/{cid}").json()["member_count"] == 2
+
+    client.delete(f"/communities/{cid}/leave", headers=other)
+    assert client.get(f"/communities/{cid}").json()["member_count"] == 1
+
+
 def test_leave_community_not_member(client, auth_headers):
     created = _create_community(client, auth_headers)
     other = _register(client, "stranger@test.com", "Stranger")
@@ -242,6 +254,27 @@ def test_merge_communities(client, auth_headers):
     assert source_res.json()["merged_into_id"] == target["id"]
 
 
+def test_merge_skips_shared_members_and_keeps_count(client, auth_headers):
+    source = _create_community(client, auth_headers, name="Small Group", plz="10115", city="Berlin")
+    target = _create_community(client, auth_headers, name="Big Group", plz="10115", city="Berlin")
+    both = _register(client, "both@test.com", "Both")
+    only_source = _register(client, "only_source@test.com", "OnlySource")
+    client.post(f"/communities/{source['id']}/join", headers=both)
+    client.post(f"/communities/{target['id']}/join", headers=both)
+    client.post(f"/communities/{source['id']}/join", headers=only_source)
+
+    res = client.post(
+        "/communities/merge",
+        headers=auth_headers,
+        json={"source_id": source["id"], "target_id": target["id"]},
+    )
+    assert res.status_code == 200
+    # creator + both (already in target) + only_source
+    assert res.json()["member_count"] == 3
+    members = client.get(f"/communities/{target['id']}/members").json()
+    assert len(members) == 3
+
+
 def test_merge_self_fails(client, auth_headers):
     community = _create_community(client, auth_headers)
     res = client.post(
@@ -335,6 +368,21 @@ def test_merge_suggestions_same_city(client, auth_headers):
     assert suggestions[0]["reason"].startswith("Same city")
 
 
+def test_merge_suggestions_rank_same_plz_first(client, auth_headers):
+    a = _create_community(client, auth_headers, name="Group A", plz="10115", city="Berlin")
+    city = _create_community(client, auth_headers, name="Group B", plz="10999", city="Berlin")
+    plz = _create_community(client, auth_headers, name="Group C", plz="10115", city="Berlin")
+
+    res = client.get(
+        f"/communities/merge/suggestions?community_id={a['id']}",
+        headers=auth_headers,
+    )
+    assert res.status_code == 200
+    suggestions = res.json()
+    assert [s["target"]["id"] for s in suggestions] == [plz["id"], city["id"]]
+    assert suggestions[0]["source"]["created_by"]["id"] == a["created_by"]["id"]
+
+
 def test_search_excludes_merged(client, auth_headers):
     source = _create_community(client, auth_headers, name="Old", plz="10115", city="Berlin")
     target = _create_community(client, auth_headers, name="New", plz="10115", city="Berlin")
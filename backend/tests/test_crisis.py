@@ -1,5 +1,8 @@
 """Tests for Red Sky (crisis) mode: toggle, voting, emergency tickets, leaders."""
 
+from app.models.activity import Activity
+from app.models.community import Community
+
 
 def _register(client, email, name="User"):
     """Helper: register a user and return auth headers."""
@@ -223,6 +226,53 @@ def test_vote_threshold_triggers_mode_switch(client, auth_headers):
     assert status["votes_to_activate"] == 0
 
 
+def test_status_cached_until_vote(client, auth_headers, db):
+    c = _create_community(client, auth_headers)
+    cid = c["id"]
+    other = _register(client, "m2@test.com", "M2")
+    client.post(f"/communities/{cid}/join", headers=other)
+
+    assert client.get(f"/communities/{cid}/crisis/status").json()["mode"] == "blue"
+    # A direct DB write bypasses invalidation, so the cached status is served.
+    db.query(Community).filter(Community.id == cid).update({"mode": "red"})
+    db.commit()
+    assert client.get(f"/communities/{cid}/crisis/status").json()["mode"] == "blue"
+
+    client.post(
+        f"/communities/{cid}/crisis/vote",
+        headers=auth_headers,
+        json={"vote_type": "activate"},
+    )
+    status = client.get(f"/communities/{cid}/crisis/status").json()
+    assert status["mode"] == "red"
+    assert status["votes_to_activate"] == 1
+
+
+def test_vote_for_current_mode_does_not_switch_again(client, auth_headers, db):
+    """A vote crossing the threshold for the mode already active logs nothing."""
+    c = _create_community(client, auth_headers)
+    cid = c["id"]
+    client.post(
+        f"/communities/{cid}/crisis/toggle",
+        headers=auth_headers,
+        json={"mode": "red"},
+    )
+
+    res = client.post(
+        f"/communities/{cid}/crisis/vote",
+        headers=auth_headers,
+        json={"vote_type": "activate"},
+    )
+    assert res.status_code == 200
+
+    status = client.get(f"/communities/{cid}/crisis/status").json()
+    assert status["mode"] == "red"
+    # The vote stays: nothing switched, so nothing cleared it
+    assert status["votes_to_activate"] == 1
+    switches = db.query(Activity).filter(Activity.event_type == "crisis_mode_changed").count()
+    assert switches == 1  # the admin toggle only
+
+
 # ── Emergency tickets ─────────────────────────────────────────────
 
 
@@ -576,6 +626,29 @@ def test_communities_map_endpoint(client, auth_headers):
     assert all("name" in c and "city" in c for c in data)
 
 
+def test_communities_map_counts(client, auth_headers):
+    a = _create_community(client, auth_headers, name="Group A", plz="10115", city="Berlin")
+    _create_community(client, auth_headers, name="Group B", plz="80331", city="Munich")
+    for title in ("Drill", "Ladder"):
+        client.post(
+            "/resources",
+            headers=auth_headers,
+            json={"title": title, "category": "tool", "community_id": a["id"]},
+        )
+    client.post(
+        "/skills",
+        headers=auth_headers,
+        json={"title": "Maths", "category": "tutoring", "skill_type": "offer", "community_id": a["id"]},
+    )
+
+    by_name = {c["name"]: c for c in client.get("/communities/map").json()}
+    assert by_name["Group A"]["member_count"] == 1
+    assert by_name["Group A"]["resource_count"] == 2
+    assert by_name["Group A"]["skill_count"] == 1
+    assert by_name["Group B"]["resource_count"] == 0
+    assert by_name["Group B"]["skill_count"] == 0
+
+
 def test_map_excludes_merged(client, auth_headers):
     a = _create_community(client, auth_headers, name="Old", plz="10115", city="Berlin")
     b = _create_community(client, auth_headers, name="New", plz="10115", city="Berlin")
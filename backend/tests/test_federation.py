@@ -1,8 +1,9 @@
 """Tests for federation endpoints – instance directory, alerts, data export/import."""
 
 import datetime
-from unittest.mock import patch, MagicMock
+from unittest.mock import AsyncMock, patch, MagicMock
 
+import httpx
 import pytest
 
 from app.models.federation import KnownInstance, RedSkyAlert
@@ -178,7 +179,7 @@ class TestInstanceDirectory:
         )
         assert res.status_code == 404
 
-    @patch("app.routers.federation._fetch_instance_info")
+    @patch("app.routers.federation._fetch_instance_info_async", new_callable=AsyncMock)
     def test_refresh_directory(self, mock_fetch, client, db):
         admin_headers = _make_admin(client, db)
         _seed_instance(db)
@@ -198,6 +199,44 @@ class TestInstanceDirectory:
         assert data[0]["name"] == "Updated Name"
         assert data[0]["resource_count"] == 50
 
+    @patch("app.routers.federation._fetch_instance_info_async", new_callable=AsyncMock)
+    def test_refresh_marks_each_instance(self, mock_fetch, client, db):
+        admin_headers = _make_admin(client, db)
+        _seed_instance(db, url="https://up.example.com", name="Up")
+        _seed_instance(db, url="https://down.example.com", name="Down")
+        mock_fetch.side_effect = lambda _client, url: (
+            {"name": "Up v2"} if url == "https://up.example.com" else None
+        )
+        res = client.post("/federation/directory/refresh", headers=admin_headers)
+        assert res.status_code == 200
+        by_url = {i["url"]: i for i in res.json()}
+        assert by_url["https://up.example.com"]["name"] == "Up v2"
+        assert by_url["https://up.example.com"]["is_reachable"] is True
+        assert by_url["https://down.example.com"]["is_reachable"] is False
+
+    def test_refresh_bounds_concurrent_fetches(self, client, db):
+        import asyncio
+
+        admin_headers = _make_admin(client, db)
+        for i in range(4):
+            _seed_instance(db, url=f"https://i{i}.example.com")
+        in_flight, peak = 0, 0
+
+        async def fetch(_client, url):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"name": url}
+
+        with patch("app.routers.federation._FEDERATION_CONCURRENCY", 2), patch(
+            "app.routers.federation._fetch_instance_info_async", side_effect=fetch
+        ):
+            res = client.post("/federation/directory/refresh", headers=admin_headers)
+        assert res.status_code == 200
+        assert peak == 2
+
     def test_refresh_unauthenticated(self, client):
         res = client.post("/federation/directory/refresh")
         assert res.status_code == 403
@@ -284,6 +323,49 @@ class TestAlerts:
         )
         assert res.status_code == 403
 
+    def test_list_alerts_cached_until_write(self, client, db):
+        _seed_instance(db)
+        assert client.get("/federation/alerts").json() == []
+        # A direct DB write bypasses invalidation, so the cached list is served.
+        _seed_alert(db)
+        assert client.get("/federation/alerts").json() == []
+        res = client.post(
+            "/federation/alerts/receive",
+            json={
+                "source_instance_url": "https://remote.example.com",
+                "source_instance_name": "Remote NG",
+                "title": "Storm",
+            },
+        )
+        assert res.status_code == 201
+        assert len(client.get("/federation/alerts").json()) == 2
+
+    def test_broadcast_alert_tallies_each_instance(self, client, db):
+        admin_headers = _make_admin(client, db)
+        _seed_instance(db, url="https://up.example.com")
+        _seed_instance(db, url="https://down.example.com")
+        _seed_instance(db, url="https://broken.example.com")
+
+        def handler(request):
+            if request.url.host == "down.example.com":
+                raise httpx.ConnectError("unreachable", request=request)
+            if request.url.host == "broken.example.com":
+                return httpx.Response(500)
+            return httpx.Response(201, json={})
+
+        real_client = httpx.AsyncClient
+        with patch(
+            "app.routers.federation.httpx.AsyncClient",
+            lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw),
+        ):
+            res = client.post(
+                "/federation/alerts/send",
+                json={"title": "Flood", "severity": "critical"},
+                headers=admin_headers,
+            )
+        assert res.status_code == 200
+        assert res.json() == {"sent": 1, "failed": 2, "total": 3}
+
     def test_dismiss_not_found(self, client, db):
         admin_headers = _make_admin(client, db)
         res = client.patch(
@@ -310,6 +392,32 @@ class TestDataExport:
         assert "reviews" in data
         assert "communities" in data
 
+    def test_export_includes_both_message_directions_and_roles(self, client, auth_headers):
+        cid = client.post(
+            "/communities",
+            headers=auth_headers,
+            json={"name": "Export Test", "postal_code": "10115", "city": "Berlin"},
+        ).json()["id"]
+        res = client.post(
+            "/auth/register",
+            json={"email": "other@example.com", "password": "Password123", "display_name": "Other"},
+        )
+        other = {"Authorization": f"Bearer {res.json()['access_token']}"}
+        client.post(f"/communities/{cid}/join", headers=other)
+        me_id = client.get("/users/me", headers=auth_headers).json()["id"]
+        other_id = client.get("/users/me", headers=other).json()["id"]
+        client.post("/messages", headers=auth_headers, json={"recipient_id": other_id, "body": "Out"})
+        client.post("/messages", headers=other, json={"recipient_id": me_id, "body": "In"})
+
+        data = client.get("/federation/export/my-data", headers=auth_headers).json()
+        assert sorted((m["direction"], m["body"]) for m in data["messages"]) == [
+            ("received", "In"),
+            ("sent", "Out"),
+        ]
+        assert data["communities"] == [
+            {"name": "Export Test", "postal_code": "10115", "city": "Berlin", "role": "admin"}
+        ]
+
     def test_export_unauthenticated(self, client):
         res = client.get("/federation/export/my-data")
         assert res.status_code == 403
@@ -1,12 +1,14 @@
 """Tests for decentralized instance data sync endpoints."""
 
 import datetime
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from app.models.federation import KnownInstance
 from app.models.sync import FederatedResource, FederatedSkill, InstanceSyncLog
+from app.routers.federation_sync import InstanceSnapshot
 
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
@@ -108,6 +110,35 @@ class TestSnapshotEndpoint:
         assert data["skills"] == []
         assert "snapshot_at" in data
 
+    def test_snapshot_stream_body_is_valid_json(self, client, auth_headers, community_id):
+        client.post(
+            "/resources",
+            json={"title": "Drill", "category": "tool", "community_id": community_id},
+            headers=auth_headers,
+        )
+        res = client.get("/federation/sync/snapshot")
+        data = json.loads(res.content)
+        assert [r["title"] for r in data["resources"]] == ["Drill"]
+        assert data["skills"] == []
+
+    @pytest.mark.parametrize("header", [{}, {"instance_url": "https://a.example", "n": 1}])
+    def test_stream_snapshot_envelope(self, db, header):
+        from sqlalchemy import false, select
+
+        from app.models.resource import Resource
+        from app.models.skill import Skill
+        from app.routers.federation_sync import _stream_snapshot
+
+        body = b"".join(
+            _stream_snapshot(
+                db.get_bind(),
+                header,
+                select(Resource.id).where(false()),
+                select(Skill.id).where(false()),
+            )
+        )
+        assert json.loads(body) == {**header, "resources": [], "skills": []}
+
     def test_snapshot_includes_local_available_resource(self, client, auth_headers, community_id):
         # Create a resource
         resp = client.post(
@@ -132,6 +163,30 @@ class TestSnapshotEndpoint:
         assert r["is_available"] is True
         assert "remote_id" in r
 
+    def test_snapshot_stream_matches_schema(self, client, auth_headers, community_id):
+        client.post(
+            "/resources",
+            headers=auth_headers,
+            json={"title": "Ladder", "category": "tool", "community_id": community_id},
+        )
+        client.post(
+            "/skills",
+            headers=auth_headers,
+            json={
+                "title": "Maths",
+                "category": "tutoring",
+                "skill_type": "offer",
+                "community_id": community_id,
+            },
+        )
+        res = client.get("/federation/sync/snapshot")
+        assert res.status_code == 200
+        snapshot = InstanceSnapshot.model_validate_json(res.content)
+        assert snapshot.resources[0].community_name == "Test Community"
+        assert snapshot.resources[0].owner_display_name == "Test User"
+        assert snapshot.skills[0].community_name == "Test Community"
+        assert snapshot.skills[0].owner_display_name == "Test User"
+
     def test_snapshot_excludes_unavailable_resources(self, client, auth_headers, community_id, db):
         from app.models.resource import Resource
 
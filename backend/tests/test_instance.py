@@ -30,3 +30,18 @@ def test_instance_info_counts_communities(client, auth_headers):
     )
     res = client.get("/instance/info")
     assert res.json()["community_count"] == 1
+
+
+def test_instance_info_counts_are_cached(client):
+    """Counts are served from cache until it expires."""
+    from app.routers.instance import _info_cache
+
+    assert client.get("/instance/info").json()["user_count"] == 0
+    client.post(
+        "/auth/register",
+        json={"email": "new@example.com", "password": "Password123", "display_name": "New"},
+    )
+    assert client.get("/instance/info").json()["user_count"] == 0
+
+    _info_cache.invalidate()
+    assert client.get("/instance/info").json()["user_count"] == 1
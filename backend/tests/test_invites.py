@@ -73,6 +73,12 @@ def test_create_invite_non_member(client, auth_headers):
     assert res.status_code == 403
 
 
+def test_create_invite_unknown_community(client, auth_headers):
+    """Inviting to a community that doesn't exist is a 404."""
+    res = client.post("/invites", headers=auth_headers, json={"community_id": 99999})
+    assert res.status_code == 404
+
+
 def test_create_invite_requires_auth(client, auth_headers):
     """Invite creation requires authentication."""
     community_id = _create_community(client, auth_headers)
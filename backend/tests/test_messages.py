@@ -302,6 +302,28 @@ def test_list_conversations(client):
     assert names == {"Bob", "Carol"}
 
 
+def test_conversation_summary_last_message_and_unread(client):
+    alice = _register(client, "alice@test.com", "Alice")
+    bob = _register(client, "bob@test.com", "Bob")
+    carol = _register(client, "carol@test.com", "Carol")
+    alice_id = _get_user_id(client, alice)
+    bob_id = _get_user_id(client, bob)
+    _make_community_trio(client, alice, bob, carol)
+
+    client.post("/messages", headers=bob, json={"recipient_id": alice_id, "body": "One"})
+    client.post("/messages", headers=bob, json={"recipient_id": alice_id, "body": "Two"})
+    client.post("/messages", headers=carol, json={"recipient_id": alice_id, "body": "Hey"})
+    client.post(f"/messages/conversation/{_get_user_id(client, carol)}/read", headers=alice)
+    client.post("/messages", headers=alice, json={"recipient_id": bob_id, "body": "Reply"})
+
+    res = client.get("/messages/conversations", headers=alice)
+    by_name = {c["partner"]["display_name"]: c for c in res.json()}
+    assert by_name["Bob"]["last_message_body"] == "Reply"
+    assert by_name["Bob"]["unread_count"] == 2
+    assert by_name["Carol"]["last_message_body"] == "Hey"
+    assert by_name["Carol"]["unread_count"] == 0
+
+
 # ── Unread count ────────────────────────────────────────────────────
 
 
@@ -108,6 +108,24 @@ def test_filter_by_category(client, auth_headers, community_id):
     assert data["items"][0]["category"] == "tool"
 
 
+def test_list_total_counts_beyond_page(client, auth_headers, community_id):
+    for title in ("Rake", "Hoe", "Spade"):
+        client.post(
+            "/resources",
+            headers=auth_headers,
+            json={"title": title, "category": "tool", "community_id": community_id},
+        )
+
+    data = client.get("/resources?limit=2").json()
+    assert len(data["items"]) == 2
+    assert data["total"] == 3
+
+    # A page past the end still reports the full total.
+    data = client.get("/resources?skip=5").json()
+    assert data["items"] == []
+    assert data["total"] == 3
+
+
 def test_create_resource_requires_auth(client):
     res = client.post("/resources", json={"title": "X", "category": "tool", "community_id": 1})
     assert res.status_code == 403
@@ -302,3 +302,53 @@ def test_csrf_middleware_blocks_wrong_origin(client, monkeypatch):
     )
     assert res.status_code == 403
     assert "Origin" in res.json()["detail"]
+
+
+# ── Security headers ─────────────────────────────────────────────────────────
+
+
+def test_security_headers_present(client):
+    res = client.get("/status")
+    assert res.headers["X-Content-Type-Options"] == "nosniff"
+    assert res.headers["X-Frame-Options"] == "DENY"
+    assert res.headers["Referrer-Policy"] == "strict-origin-when-cross-origin"
+    # HSTS and CSP are production-only
+    assert "Strict-Transport-Security" not in res.headers
+    assert "Content-Security-Policy" not in res.headers
+
+
+def test_security_headers_production_adds_hsts_and_csp(client, monkeypatch):
+    import app.config as cfg
+
+    monkeypatch.setattr(cfg.settings, "debug", False)
+    res = client.get("/status")
+    assert res.headers["Strict-Transport-Security"] == "max-age=63072000; includeSubDomains"
+    assert res.headers["Content-Security-Policy"] == "default-src 'self'"
+
+
+# ── CORS ─────────────────────────────────────────────────────────────────────
+
+
+def test_cors_preflight_allows_app_headers(client):
+    res = client.options(
+        "/auth/login",
+        headers={
+            "Origin": "http://localhost:3800",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "authorization, content-type, x-csrf-token",
+        },
+    )
+    assert res.status_code == 200
+    assert "POST" in res.headers["Access-Control-Allow-Methods"]
+
+
+def test_cors_preflight_rejects_unlisted_header(client):
+    res = client.options(
+        "/auth/login",
+        headers={
+            "Origin": "http://localhost:3800",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "x-not-allowed",
+        },
+    )
+    assert res.status_code == 400
@@ -0,0 +1,103 @@
+"""Tests for the startup schema drift safety net in ``app.main``."""
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.pool import StaticPool
+
+import app.main as main_module
+
+
+@pytest.fixture()
+def legacy_engine(monkeypatch):
+    """An empty in-memory database swapped in for the application engine."""
+    eng = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    monkeypatch.setattr(main_module, "engine", eng)
+    yield eng
+    eng.dispose()
+
+
+def _columns(eng, table: str) -> set[str]:
+    return {c["name"] for c in inspect(eng).get_columns(table)}
+
+
+def test_add_missing_columns_fills_legacy_table(legacy_engine):
+    """Columns present on the model but absent from the DB are added."""
+    with legacy_engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE users (id INTEGER PRIMARY KEY, email VARCHAR(255), "
+            "hashed_password VARCHAR(255), display_name VARCHAR(100), "
+            "neighbourhood VARCHAR(100), role VARCHAR(20), is_active BOOLEAN, "
+            "created_at DATETIME)"
+        ))
+
+    main_module._add_missing_columns()
+
+    cols = _columns(legacy_engine, "users")
+    assert {"mesh_public_key", "language_code", "telegram_chat_id"} <= cols
+
+
+def test_add_missing_columns_is_noop_when_current(legacy_engine):
+    """A database that already matches the models is left untouched."""
+    main_module.Base.metadata.create_all(bind=legacy_engine)
+    before = _columns(legacy_engine, "users")
+
+    main_module._add_missing_columns()
+
+    assert _columns(legacy_engine, "users") == before
+
+
+def test_schema_is_current_detects_missing_table_and_column(legacy_engine):
+    """The startup fast path is only taken when nothing is missing."""
+    assert not main_module._schema_is_current(main_module._existing_columns())
+
+    main_module.Base.metadata.create_all(bind=legacy_engine)
+    assert main_module._schema_is_current(main_module._existing_columns())
+
+    present = main_module._existing_columns()
+    present["users"].discard("mesh_public_key")
+    assert not main_module._schema_is_current(present)
+
+
+def test_lifespan_creates_only_missing_tables(legacy_engine):
+    """Startup creates absent tables next to existing ones without errors."""
+    import asyncio
+
+    main_module.Base.metadata.tables["users"].create(bind=legacy_engine)
+
+    async def _run():
+        async with main_module.lifespan(main_module.app):
+            pass
+
+    asyncio.run(_run())
+
+    present = main_module._existing_columns()
+    assert main_module._schema_is_current(present)
+
+
+def test_add_missing_columns_backfills_member_count(legacy_engine):
+    """A drift-added member_count is computed from existing memberships."""
+    main_module.Base.metadata.create_all(bind=legacy_engine)
+    with legacy_engine.begin() as conn:
+        conn.execute(text("ALTER TABLE communities DROP COLUMN member_count"))
+        conn.execute(text(
+            "INSERT INTO users (id, email, hashed_password, display_name, role, "
+            "is_active, language_code) VALUES (1, 'a@b.c', 'x', 'A', 'member', 1, 'en'), "
+            "(2, 'b@b.c', 'x', 'B', 'member', 1, 'en')"
+        ))
+        conn.execute(text(
+            "INSERT INTO communities (id, name, postal_code, city, country_code, "
+            "is_active, mode, created_by_id) VALUES (1, 'C', '1', 'X', 'DE', 1, 'blue', 1)"
+        ))
+        conn.execute(text(
+            "INSERT INTO community_members (community_id, user_id, role) "
+            "VALUES (1, 1, 'admin'), (1, 2, 'member')"
+        ))
+
+    main_module._add_missing_columns()
+
+    with legacy_engine.connect() as conn:
+        assert conn.execute(text("SELECT member_count FROM communities")).scalar() == 2
@@ -95,6 +95,54 @@ def test_list_tickets_sorted_by_priority(client, auth_headers):
     assert items[-1]["urgency"] == "low"
 
 
+def test_priority_sort_pages_overdue_first(client, auth_headers):
+    cid = _community(client, auth_headers)
+    overdue = (datetime.datetime.utcnow() - datetime.timedelta(hours=1)).isoformat()
+    _create_ticket(client, auth_headers, cid, urgency="low", title="Low")
+    _create_ticket(client, auth_headers, cid, urgency="critical", title="Critical")
+    _create_ticket(client, auth_headers, cid, urgency="high", title="Overdue", due_at=overdue)
+
+    pages = [
+        client.get(
+            f"/communities/{cid}/tickets",
+            headers=auth_headers,
+            params={"sort": "priority_desc", "skip": skip, "limit": 1},
+        ).json()
+        for skip in range(3)
+    ]
+    assert [p["items"][0]["title"] for p in pages] == ["Overdue", "Critical", "Low"]
+    assert {p["total"] for p in pages} == {3}
+
+
+def test_list_tickets_query_count_independent_of_page_size(client, auth_headers, count_queries):
+    cid = _community(client, auth_headers)
+    member = _register(client, "assignee@test.com", "Assignee")
+    client.post(f"/communities/{cid}/join", headers=member)
+    assignee_id = client.get("/users/me", headers=member).json()["id"]
+
+    def _list():
+        with count_queries() as statements:
+            res = client.get(
+                f"/communities/{cid}/tickets",
+                headers=auth_headers,
+                params={"sort": "priority_desc"},
+            )
+        assert res.status_code == 200
+        return len(statements)
+
+    tid = _create_ticket(client, auth_headers, cid).json()["id"]
+    res = client.patch(
+        f"/communities/{cid}/tickets/{tid}",
+        headers=auth_headers,
+        json={"assigned_to_id": assignee_id},
+    )
+    assert res.json()["assigned_to"]["id"] == assignee_id
+    one_ticket = _list()
+    for i in range(5):
+        _create_ticket(client, auth_headers, cid, title=f"Ticket {i}")
+    assert _list() == one_ticket
+
+
 def test_list_tickets_default_sort_is_created_desc(client, auth_headers):
     cid = _community(client, auth_headers)
     _create_ticket(client, auth_headers, cid, title="Alpha")
@@ -123,7 +123,9 @@ export interface ActivityOut {
 
 export interface ActivityList {
 	items: ActivityOut[];
-	total: number;
+	total: number | null;
+	has_more: boolean;
+	next_cursor: string | null;
 }
 
 export type ResourceItem = Resource;